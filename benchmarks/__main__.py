@@ -0,0 +1,53 @@
+"""
+Runs the benchmarks without airspeed velocity, e.g. `python -m benchmarks bench_remap`. The benchmark classes follow the asv conventions:
+`setup` is called with the parameters before the `time_*` methods are timed, the peak allocation of the `peakmem_*` methods is measured with `tracemalloc`
+and the values returned by the `track_*` methods are printed. With `--quick`, only the first value of each parameter is used.
+"""
+import importlib
+import inspect
+import itertools
+import pkgutil
+import sys
+import timeit
+import tracemalloc
+
+import benchmarks
+
+
+def run(module_names: list = None, quick: bool = False, repeat: int = 3) -> None:
+    module_names = module_names or [m.name for m in pkgutil.iter_modules(benchmarks.__path__) if m.name.startswith('bench_')]
+
+    for module_name in module_names:
+        module = importlib.import_module(f'benchmarks.{module_name}')
+        for (cls_name, cls) in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+
+            params = getattr(cls, 'params', [[]])
+            params = params if params and isinstance(params[0], list) else [params]
+            if quick:
+                params = [values[:1] for values in params]
+
+            for args in itertools.product(*params):
+                bench = cls()
+                if hasattr(bench, 'setup'):
+                    bench.setup(*args)
+
+                for (method_name, method) in inspect.getmembers(bench, inspect.ismethod):
+                    if method_name.startswith('time_'):
+                        secs = min(timeit.repeat(lambda: method(*args), number=1, repeat=repeat))
+                        print(f'{module_name}.{cls_name}.{method_name}{list(args)}: {secs * 1000:.2f} ms')
+                    elif method_name.startswith('peakmem_'):
+                        tracemalloc.start()
+                        try:
+                            method(*args)
+                            peak = tracemalloc.get_traced_memory()[1]
+                        finally:
+                            tracemalloc.stop()
+                        print(f'{module_name}.{cls_name}.{method_name}{list(args)}: {peak / 1e6:.1f} MB')
+                    elif method_name.startswith('track_'):
+                        print(f'{module_name}.{cls_name}.{method_name}{list(args)}: {method(*args):.2f} {getattr(method, "unit", "")}')
+
+
+if __name__ == '__main__':
+    run([arg for arg in sys.argv[1:] if not arg.startswith('--')], quick='--quick' in sys.argv)
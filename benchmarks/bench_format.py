@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from datadict import DataDict
+
+
+def legacy_format(df: pd.DataFrame, formats: dict) -> pd.DataFrame:
+    """
+    The per-cell formatting that `DataDict.format` used before formats were compiled. It serves as the baseline.
+    """
+    df = df.copy()
+    for (col, f) in formats.items():
+        df[col] = df[col].apply(lambda x: f.format(x) if not pd.isnull(x) else '-')
+
+    return df
+
+
+class Format:
+    """
+    Compares `DataDict.format` with the legacy per-cell implementation for the typical report formats.
+    """
+    params = [1_000, 100_000, 1_000_000]
+    param_names = ['rows']
+
+    def setup(self, rows: int):
+        formats = {'Cost': '£{:.1f}m', 'Points': '{:d}', 'Minutes': '{:,.0f}', 'Share': '{:.0f}%', 'Kick Off': '{:%B %d, %Y}'}
+        self.dd = DataDict(data_dict=pd.DataFrame({'Data Set': 'bench', 'Field': list(formats.keys()), 'Name': list(formats.keys()), 'Description': '',
+                                                   'Type': ['float', 'int', 'float', 'float', 'datetime64'], 'Format': list(formats.values())}))
+        self.formats = formats
+
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({'Cost': rng.integers(40, 130, rows) / 10,
+                                'Points': rng.integers(0, 300, rows),
+                                'Minutes': rng.integers(0, 100_000, rows).astype(float),
+                                'Share': rng.random(rows) * 100,
+                                'Kick Off': pd.Timestamp('2019-08-09') + pd.to_timedelta(rng.integers(0, 38, rows) * 7, unit='D')})
+        self.df.loc[::10, 'Cost'] = np.nan
+
+    def time_legacy(self, rows: int):
+        legacy_format(self.df, self.formats)
+
+    def time_format(self, rows: int):
+        self.dd.format(self.df)
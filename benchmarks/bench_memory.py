@@ -0,0 +1,34 @@
+"""
+Measures the peak memory `DataDict.remap` allocates relative to the size of the input frame with and without `copy`.
+"""
+import tracemalloc
+from benchmarks.common import DATA_SET, make_data_dict, make_raw_frame
+
+
+class RemapMemory:
+    """
+    Remaps a frame with 20 columns of raw values of mixed types. Without `copy`, the peak allocation should stay close to the size of the input frame
+    because the output is assembled once from the converted columns.
+    """
+    params = [[100_000, 1_000_000], [True, False]]
+    param_names = ['rows', 'copy']
+
+    def setup(self, rows: int, copy: bool):
+        self.dd = make_data_dict(100, 'mixed')
+        self.raw_df = make_raw_frame(self.dd, rows, 20)
+        self.dd.remap(self.raw_df.head(), DATA_SET, copy=copy)
+
+    def peakmem_remap(self, rows: int, copy: bool):
+        self.dd.remap(self.raw_df, DATA_SET, copy=copy)
+
+    def track_peak_ratio(self, rows: int, copy: bool) -> float:
+        tracemalloc.start()
+        try:
+            self.dd.remap(self.raw_df, DATA_SET, copy=copy)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return peak / self.raw_df.memory_usage(index=False).sum()
+
+    track_peak_ratio.unit = 'x input'
@@ -0,0 +1,24 @@
+"""
+Benchmarks `DataDict.remap_parallel` against `DataDict.remap` on a single process. The speedup depends on the number of CPUs of the machine.
+"""
+import os
+from benchmarks.common import DATA_SET, make_data_dict, make_raw_frame
+
+
+class Parallel:
+    """
+    Remaps a frame with 20 columns of mixed types on a single process and on a pool of worker processes.
+    """
+    params = [[100_000, 1_000_000, 5_000_000], sorted({1, 2, 4, os.cpu_count() or 1})]
+    param_names = ['rows', 'workers']
+    timeout = 600
+
+    def setup(self, rows: int, workers: int):
+        self.dd = make_data_dict(100, 'mixed')
+        self.raw_df = make_raw_frame(self.dd, rows, 20)
+
+    def time_remap(self, rows: int, workers: int):
+        self.dd.remap(self.raw_df, DATA_SET)
+
+    def time_remap_parallel(self, rows: int, workers: int):
+        self.dd.remap_parallel(self.raw_df, DATA_SET, workers=workers)
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+from datadict import DataDict
+
+
+def legacy_str_normalisation(df: pd.DataFrame, str_cols: list) -> pd.DataFrame:
+    """
+    The per-element string normalisation that `DataDict.remap` used before it was vectorised. It serves as the baseline.
+    """
+    df[str_cols] = df[str_cols].apply(lambda col: col.map(lambda val: val if isinstance(val, str) and val != '' else None))
+    return df.replace('', np.nan)
+
+
+def legacy_bool_parsing(df: pd.DataFrame, bool_cols: list) -> pd.DataFrame:
+    """
+    The per-element bool parsing that `DataDict.remap` used before it was vectorised. It serves as the baseline.
+    """
+    def str_to_bool(value):
+        if pd.isnull(value):
+            return None
+
+        if not isinstance(value, str):
+            return value
+
+        return value.lower() in ['yes', 'true', '1']
+
+    df[bool_cols] = df[bool_cols].apply(lambda col: col.map(str_to_bool))
+    return df
+
+
+class StrNormalisation:
+    """
+    Compares the vectorised string normalisation in `DataDict.remap` with the legacy per-element implementation.
+    """
+    params = [1_000, 100_000, 1_000_000]
+    param_names = ['rows']
+
+    def setup(self, rows: int):
+        str_cols = [f'str_{i}' for i in range(5)]
+        self.dd = DataDict(data_dict=pd.DataFrame({'Data Set': 'bench', 'Field': str_cols, 'Name': [f'Str {i}' for i in range(5)],
+                                                   'Description': '', 'Type': 'str', 'Format': ''}))
+        self.str_cols = str_cols
+
+        values = np.array(['alpha', 'beta', '', 'gamma', None], dtype=object)
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({col: values[rng.integers(0, len(values), rows)] for col in str_cols})
+        self.df['float_0'] = rng.random(rows)
+        self.df['int_0'] = rng.integers(0, 100, rows)
+
+    def time_legacy(self, rows: int):
+        legacy_str_normalisation(self.df.copy(), self.str_cols)
+
+    def time_remap(self, rows: int):
+        self.dd.remap(self.df, 'bench')
+
+
+class BoolParsing:
+    """
+    Compares the vectorised bool parsing in `DataDict.remap` with the legacy per-element implementation.
+    """
+    params = [1_000, 100_000, 1_000_000]
+    param_names = ['rows']
+
+    def setup(self, rows: int):
+        bool_cols = [f'bool_{i}' for i in range(5)]
+        self.dd = DataDict(data_dict=pd.DataFrame({'Data Set': 'bench', 'Field': bool_cols, 'Name': [f'Bool {i}' for i in range(5)],
+                                                   'Description': '', 'Type': 'bool', 'Format': ''}))
+        self.bool_cols = bool_cols
+
+        values = np.array(['Yes', 'no', 'TRUE', 'false', '1', '0', None], dtype=object)
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({col: values[rng.integers(0, len(values), rows)] for col in bool_cols})
+
+    def time_legacy(self, rows: int):
+        legacy_bool_parsing(self.df.copy(), self.bool_cols)
+
+    def time_remap(self, rows: int):
+        self.dd.remap(self.df, 'bench')
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from datadict import DataDict
+
+
+def legacy_reorder(df: pd.DataFrame, names: list) -> pd.DataFrame:
+    """
+    The list based `DataDict.reorder` that was quadratic in the number of columns. It serves as the baseline.
+    """
+    return df[[x for x in names if x in list(df.columns.values)] + [x for x in list(df.columns.values) if x not in names]]
+
+
+class WideFrames:
+    """
+    Reorders and strips wide data frames against large data dictionaries. Half of the columns are in the data dictionary.
+    """
+    params = [[1_000, 10_000], [1_000, 5_000]]
+    param_names = ['columns', 'names']
+
+    def setup(self, columns: int, names: int):
+        rng = np.random.default_rng(0)
+        dd_names = [f'Name {i}' for i in range(names)]
+        self.dd = DataDict(data_dict=pd.DataFrame({'Data Set': 'bench', 'Field': [f'field_{i}' for i in range(names)], 'Name': dd_names,
+                                                   'Description': '', 'Type': 'float', 'Format': ''}))
+        self.names = dd_names
+
+        cols = [f'Name {i}' for i in rng.permutation(names)[:columns // 2]] + [f'extra_{i}' for i in range(columns - columns // 2)]
+        self.df = pd.DataFrame(rng.random((10, len(cols))), columns=rng.permutation(cols))
+
+    def time_reorder(self, columns: int, names: int):
+        self.dd.reorder(self.df)
+
+    def time_strip_cols(self, columns: int, names: int):
+        self.dd.strip_cols(self.df, 'bench')
+
+    def time_legacy_reorder(self, columns: int, names: int):
+        legacy_reorder(self.df, self.names)
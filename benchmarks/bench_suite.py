@@ -0,0 +1,66 @@
+"""
+Benchmarks the main `DataDict` operations across data sizes, dictionary sizes and type mixes. Run them with airspeed velocity, e.g.
+`asv continuous master HEAD` or `asv run` followed by `asv compare`, to compare the results across commits.
+"""
+from benchmarks.common import DATA_SET, TYPE_MIXES, make_data_dict, make_frame, make_raw_frame
+
+
+class Rows:
+    """
+    Scales the number of rows of a frame with 10 columns.
+    """
+    params = [[1_000, 100_000, 1_000_000, 10_000_000], list(TYPE_MIXES.keys())]
+    param_names = ['rows', 'type_mix']
+    timeout = 600
+
+    def setup(self, rows: int, type_mix: str):
+        self.dd = make_data_dict(100, type_mix)
+        self.raw_df = make_raw_frame(self.dd, rows, 10)
+        self.df = self.dd.remap(self.raw_df, DATA_SET)
+
+    def time_remap(self, rows: int, type_mix: str):
+        self.dd.remap(self.raw_df, DATA_SET)
+
+    def time_remap_ensure_strip_cols(self, rows: int, type_mix: str):
+        self.dd.remap(self.raw_df, DATA_SET, ensure_cols=True, strip_cols=True)
+
+    def time_format(self, rows: int, type_mix: str):
+        self.dd.format(self.df)
+
+    def time_add_stats(self, rows: int, type_mix: str):
+        self.dd.add_stats(self.df)
+
+    def peakmem_remap(self, rows: int, type_mix: str):
+        self.dd.remap(self.raw_df, DATA_SET)
+
+
+class Columns:
+    """
+    Scales the number of columns of a frame with 1,000 rows against data dictionaries of different sizes.
+    """
+    params = [[10, 100, 1_000, 10_000], [100, 1_000, 5_000]]
+    param_names = ['columns', 'names']
+    timeout = 600
+
+    def setup(self, columns: int, names: int):
+        self.dd = make_data_dict(names)
+        self.raw_df = make_raw_frame(self.dd, 1_000, columns)
+        self.df = make_frame(self.dd, 1_000, columns)
+
+    def time_remap(self, columns: int, names: int):
+        self.dd.remap(self.raw_df, DATA_SET)
+
+    def time_reorder(self, columns: int, names: int):
+        self.dd.reorder(self.df)
+
+    def time_ensure_cols(self, columns: int, names: int):
+        self.dd.ensure_cols(self.df, data_set=DATA_SET)
+
+    def time_strip_cols(self, columns: int, names: int):
+        self.dd.strip_cols(self.df, data_set=DATA_SET)
+
+    def time_format(self, columns: int, names: int):
+        self.dd.format(self.df)
+
+    def time_add_stats(self, columns: int, names: int):
+        self.dd.add_stats(self.df)
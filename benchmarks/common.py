@@ -0,0 +1,81 @@
+"""
+Generates synthetic data dictionaries in the style of `data_dict_fpl.csv` and data frames that match them for the benchmarks.
+"""
+import numpy as np
+import pandas as pd
+from datadict import DataDict
+
+DATA_SET = 'player'
+
+# Type of each generated column together with the format and a pool of raw values as they would be read from a CSV file.
+TYPES = {'str': ('', ['Salah', 'Kane', 'Son', 'De Bruyne', 'Vardy', '']),
+         'float': ('£{:.1f}m', ['4.5', '5.0', '6.5', '7.5', '10.0', '12.5', '']),
+         'int': ('{:d}', [str(i) for i in range(0, 300, 7)]),
+         'bool': ('{:}', ['True', 'FALSE', 'yes', '0', '']),
+         'datetime64': ('{:%B %d, %Y}', [f'2019-{month:02d}-{day:02d}' for month in range(1, 13) for day in (1, 15)])}
+
+# Type mixes of the generated columns.
+TYPE_MIXES = {'numeric': ['float', 'int'],
+              'text': ['str', 'bool'],
+              'mixed': ['str', 'float', 'int', 'bool', 'datetime64']}
+
+
+def make_data_dict(names: int, type_mix: str = 'mixed') -> DataDict:
+    """
+    Creates a data dictionary with the given number of entries. The types of the entries rotate through the given type mix.
+
+    Args:
+        names: The number of entries.
+        type_mix: The name of the type mix in `TYPE_MIXES`.
+
+    Returns:
+        The data dictionary.
+    """
+    types = [TYPE_MIXES[type_mix][i % len(TYPE_MIXES[type_mix])] for i in range(names)]
+    return DataDict(data_dict=pd.DataFrame({'Data Set': DATA_SET,
+                                            'Field': [f'field_{i}' for i in range(names)],
+                                            'Name': [f'Name {i}' for i in range(names)],
+                                            'Description': [f'Description of field {i}' for i in range(names)],
+                                            'Type': types,
+                                            'Format': [TYPES[typ][0] for typ in types]}))
+
+
+def make_raw_frame(dd: DataDict, rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Creates a data frame with raw string values as they would be read from a CSV file for the first `columns` fields of the data dictionary.
+    If there are more columns than entries in the data dictionary, the additional columns are not in the data dictionary.
+
+    Args:
+        dd: The data dictionary created by `make_data_dict`.
+        rows: The number of rows.
+        columns: The number of columns.
+        seed: The seed of the random number generator.
+
+    Returns:
+        The data frame.
+    """
+    rng = np.random.default_rng(seed)
+    specs = dd.df(DATA_SET).reset_index()
+    df = {}
+    for i in range(columns):
+        field, typ = (specs['Field'][i], specs['Type'][i]) if i < len(specs) else (f'extra_{i}', 'str')
+        pool = np.array(TYPES[typ][1], dtype=object)
+        df[field] = pool[rng.integers(0, len(pool), rows)]
+
+    return pd.DataFrame(df)
+
+
+def make_frame(dd: DataDict, rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Creates a remapped data frame, i.e. with typed columns named after the `Name` column of the data dictionary.
+
+    Args:
+        dd: The data dictionary created by `make_data_dict`.
+        rows: The number of rows.
+        columns: The number of columns.
+        seed: The seed of the random number generator.
+
+    Returns:
+        The data frame.
+    """
+    return dd.remap(make_raw_frame(dd, rows, columns, seed), DATA_SET)
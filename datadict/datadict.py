@@ -2,11 +2,332 @@ import pandas as pd
 import numpy as np
 import warnings
 import os
-import functools
 import pickle
-from os import path
-from pandas.api.types import is_numeric_dtype
-from typing import Dict
+import ast
+import contextlib
+import functools
+import hashlib
+import string
+import tempfile
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from pandas.api.types import is_numeric_dtype, is_integer_dtype, is_float_dtype, is_bool_dtype, is_datetime64_dtype, is_dtype_equal, is_object_dtype, is_string_dtype, is_categorical_dtype, union_categoricals
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Tuple, Union
+
+
+class _FieldSpec(NamedTuple):
+    """
+    Specification of a single data dictionary entry.
+    """
+    data_set: str
+    field: str
+    name: str
+    description: str
+    type: str
+    format: str
+    aggregation: str
+    nullable: bool = None
+    parse_format: str = None
+    time_zone: str = None
+    unit: str = None
+    categories: pd.CategoricalDtype = None
+
+
+class _RemapPlan(NamedTuple):
+    """
+    Compiled remap instructions for a data set and a specific input schema. Plans are derived from the data dictionary only once
+    and then reused by `DataDict.remap` for all data frames with the same columns and types.
+    """
+    str_cols: List[str]
+    blank_cols: List[str]
+    bool_cols: List[str]
+    types_map: Dict[str, str]
+    columns_map: Dict[str, str]
+    columns: List[str]
+    missing_cols: List[str]
+    arrow_cols: Dict[str, str]
+    nullable_cols: List[str]
+    parsers: Dict[str, Tuple[str, str, str]]
+    categories: Dict[str, pd.CategoricalDtype]
+
+
+class _DataDictState(NamedTuple):
+    """
+    Data dictionary frame together with everything derived from it. A new data dictionary is published by replacing the whole state in a single
+    assignment so that concurrent readers never see the indexes of one data dictionary together with the plan cache of another.
+    """
+    data_dict: pd.DataFrame = None
+    version: str = None
+    formats: dict = MappingProxyType({})
+    names: list = ()
+    data_sets: Mapping[str, Tuple[_FieldSpec, ...]] = MappingProxyType({})
+    specs: Mapping[str, _FieldSpec] = MappingProxyType({})
+    positions: Mapping[str, int] = MappingProxyType({})
+    aggregations: Mapping[str, '_Aggregation'] = MappingProxyType({})
+    plans: OrderedDict = None
+
+
+class _Formatter:
+    """
+    Formats the values of a column with a Python format string such as `£{:.1f}m`. The format string is parsed once when the formatter is created.
+    Each distinct value of a column is only formatted once and datetime formats are rendered with `strftime` for all distinct values at once.
+    Missing values are rendered as `-`. If `integral` is true, numbers without a fraction are rendered as integers so that integer formats like `{:d}`
+    also work on the float values of nullable integer columns with stats, only numbers with a fraction such as averages are rendered with `{:.1f}` instead.
+    """
+    missing = '-'
+
+    def __init__(self, f: str, integral: bool = False):
+        self.f = f
+        self.strftime = None
+        self.fraction_f = f.replace(':d', ':.1f') if integral else None
+
+        # A format string with a single plain replacement field like `Date: {:%B %d, %Y}` can be split into a prefix, a format spec and a suffix.
+        parsed = list(string.Formatter().parse(f))
+        fields = [(i, field) for (i, field) in enumerate(parsed) if field[1] is not None]
+        if len(fields) == 1:
+            i, (literal, name, spec, conversion) = fields[0]
+            if name == '' and conversion is None and '{' not in spec and '%' in spec:
+                self.prefix = ''.join(p[0] for p in parsed[:i + 1])
+                self.suffix = ''.join(p[0] for p in parsed[i + 1:])
+                self.strftime = spec
+
+    def __call__(self, col: pd.Series) -> pd.Series:
+        """
+        Formats the given column.
+
+        Args:
+            col: The column to format.
+
+        Returns:
+            The formatted column.
+        """
+        if is_object_dtype(col.dtype) and pd.api.types.infer_dtype(col, skipna=True) not in ['string', 'empty']:
+            # Values of mixed types can't be factorized safely because values like `True` and `1` are considered equal.
+            values = [self.render(val) if not pd.isnull(val) else self.missing for val in col.values]
+            return pd.Series(values, index=col.index, name=col.name, dtype=object)
+
+        codes, uniques = pd.factorize(col)
+        if self.strftime is not None and isinstance(uniques, pd.DatetimeIndex):
+            rendered = [self.prefix + val + self.suffix for val in uniques.strftime(self.strftime)]
+        else:
+            rendered = list(map(self.render if self.fraction_f is not None else self.f.format, uniques.tolist()))
+
+        # The code of missing values is -1 and therefore points to the missing value appended at the end.
+        values = np.array(rendered + [self.missing], dtype=object)[codes]
+        return pd.Series(values, index=col.index, name=col.name)
+
+    def render(self, val) -> str:
+        """
+        Formats a single value.
+
+        Args:
+            val: The value to format.
+
+        Returns:
+            The formatted value.
+        """
+        if self.fraction_f is not None and isinstance(val, float):
+            return self.f.format(int(val)) if val.is_integer() else self.fraction_f.format(val)
+
+        return self.f.format(val)
+
+
+@functools.lru_cache(maxsize=None)
+def _formatter(f: str, integral: bool = False) -> _Formatter:
+    """
+    Gets the compiled formatter for the given format string.
+
+    Args:
+        f: The format string.
+        integral: Whether numbers without a fraction are rendered as integers. See `_Formatter` for details.
+
+    Returns:
+        The formatter.
+    """
+    return _Formatter(f, integral)
+
+
+def _pyarrow():
+    """
+    Imports `pyarrow`, which is an optional dependency that is only needed for the `pyarrow` dtype backend.
+
+    Returns:
+        The `pyarrow` module.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('The pyarrow dtype backend requires pyarrow. Install it with: pip install pandas-datadict[arrow]')
+
+    if not hasattr(pd, 'ArrowDtype'):
+        raise ImportError(f'The pyarrow dtype backend requires pandas 1.5 or later but pandas {pd.__version__} is installed.')
+
+    return pyarrow
+
+
+def _dask_dataframe():
+    """
+    Imports `dask.dataframe`, which is an optional dependency that is only needed for the Dask integration.
+
+    Returns:
+        The `dask.dataframe` module.
+
+    Raises:
+        ImportError: If `dask` is not installed.
+    """
+    try:
+        import dask.dataframe
+    except ImportError:
+        raise ImportError('The Dask integration requires dask. Install it with: pip install pandas-datadict[dask]')
+
+    return dask.dataframe
+
+
+class _Aggregation(NamedTuple):
+    """
+    Default aggregation of a column parsed from an expression like `sum()` or `quantile(0.9)` in the `Default Aggregation` column.
+    """
+    func: str
+    args: tuple = ()
+    kwargs: tuple = ()
+
+    def agg_func(self):
+        """
+        Gets the function to pass to `agg`. Aggregations without arguments are passed by name so that pandas can use its optimised implementation.
+
+        Returns:
+            The name of the aggregation or a function that calls the aggregation with its arguments.
+        """
+        if not self.args and not self.kwargs:
+            return self.func
+
+        func, args, kwargs = self.func, self.args, dict(self.kwargs)
+        return lambda series: getattr(series, func)(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _aggregation(expression: str) -> _Aggregation:
+    """
+    Parses the given default aggregation expression. Only the aggregations in `DataDict.aggregations` with literal arguments are supported.
+
+    Args:
+        expression: The expression to parse such as `sum()` or `quantile(0.9)`.
+
+    Returns:
+        The parsed aggregation.
+
+    Raises:
+        ValueError: If the expression is not supported.
+    """
+    try:
+        node = ast.parse(expression.strip(), mode='eval').body
+    except SyntaxError:
+        node = None
+
+    call = node if isinstance(node, ast.Call) else None
+    func = call.func if call is not None else node
+    if not isinstance(func, ast.Name) or func.id not in DataDict.aggregations:
+        raise ValueError(f'The default aggregation {expression} is not supported. Only the following aggregations are supported: {DataDict.aggregations}')
+
+    if call is None:
+        return _Aggregation(func.id)
+
+    try:
+        args = tuple(ast.literal_eval(arg) for arg in call.args)
+        kwargs = tuple((keyword.arg, ast.literal_eval(keyword.value)) for keyword in call.keywords if keyword.arg is not None)
+    except ValueError:
+        raise ValueError(f'The arguments of the default aggregation {expression} must be literals.')
+
+    return _Aggregation(func.id, args, kwargs)
+
+
+# Data dictionary of a worker process of `DataDict.remap_parallel`, which is unpickled once when the worker starts.
+_worker_data_dict = None
+
+
+def _init_worker(snapshot: bytes) -> None:
+    """
+    Initialises a worker process of `DataDict.remap_parallel` with the pickled data dictionary.
+
+    Args:
+        snapshot: The pickled data dictionary.
+    """
+    global _worker_data_dict
+    _worker_data_dict = pickle.loads(snapshot)
+
+
+def _remap_worker(df: pd.DataFrame, data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str, errors: str) -> pd.DataFrame:
+    """
+    Remaps the given data frame with the data dictionary of the worker process.
+
+    Returns:
+        The remapped data frame.
+    """
+    return _worker_data_dict.remap(df, data_set, ensure_cols, strip_cols, dtype_backend, errors=errors)
+
+
+class StageTiming(NamedTuple):
+    """
+    Measurements of a single stage of a `DataDict` operation like `remap`, `format` or `add_stats` that are passed to the listeners registered with
+    `DataDict.add_listener`.
+    """
+    operation: str
+    stage: str
+    seconds: float
+    rows: int
+    columns: int
+    bytes: int
+    allocated: int = None
+
+
+class _Stopwatch:
+    """
+    Measures the stages of an operation and passes their timings to the listeners in `DataDict.listeners`. It does nothing if there are no listeners
+    when the operation starts. The bytes allocated by a stage are only measured if `tracemalloc` is tracing.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.enabled = len(DataDict.listeners) > 0
+        self.tracing = self.enabled and tracemalloc.is_tracing()
+        self.__restart()
+
+    def __restart(self) -> None:
+        if self.tracing:
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+
+    def lap(self, stage: str, df: Union[pd.DataFrame, Mapping[str, pd.Series]]) -> None:
+        """
+        Ends the current stage and notifies the listeners. The time the listeners take is not included in the next stage.
+
+        Args:
+            stage: The name of the stage that ended.
+            df: The data frame produced by the stage or the columns produced by the stage if they are not assembled into a data frame yet.
+        """
+        if not self.enabled:
+            return
+
+        seconds = time.perf_counter() - self.start
+        allocated = tracemalloc.get_traced_memory()[0] - self.memory if self.tracing else None
+        if isinstance(df, pd.DataFrame):
+            (rows, columns, size) = (len(df), len(df.columns), int(df.memory_usage(index=False, deep=False).sum()))
+        else:
+            cols = list(df.values())
+            (rows, columns, size) = (len(cols[0]) if cols else 0, len(cols), sum(int(col.memory_usage(index=False, deep=False)) for col in cols))
+        timing = StageTiming(self.operation, stage, seconds, rows, columns, size, allocated)
+        for listener in tuple(DataDict.listeners):
+            listener(timing)
+
+        self.__restart()
 
 
 class DataDict:
@@ -14,244 +335,1894 @@ class DataDict:
     This class provides functionality for mapping the columns of different data frames into a consistent namespace,
     ensuring the columns to comply with the data type specified in the data dictionary and describing the data.
 
-    The data dictionary consists at least of the following columns:
-    * `Data Set`: Used when mapping in combination with `Field` to rename to the column to `Name`.
-    * `Field`: Column name of the data frame to map to `Name`.
-    * `Name`: Column name that is unique throughout the data dictionary.
-    * `Description`: Description of the column name. This can be used to provide additional information when displaying the data frame.
-    * `Type`: Type the column should be cast to.
-    * `Format`: Format to use when values need to be converted to a string representation. The format string has to be a Python format string such as `{:.0f}%`
+    The data dictionary consists at least of the following columns:
+    * `Data Set`: Used when mapping in combination with `Field` to rename to the column to `Name`.
+    * `Field`: Column name of the data frame to map to `Name`.
+    * `Name`: Column name that is unique throughout the data dictionary.
+    * `Description`: Description of the column name. This can be used to provide additional information when displaying the data frame.
+    * `Type`: Type the column should be cast to.
+    * `Format`: Format to use when values need to be converted to a string representation. The format string has to be a Python format string such as `{:.0f}%`
+
+    It can also include the following optional columns:
+    * `Default Aggregation`: Aggregation to use when the column is aggregated such as `sum()` or `quantile(0.9)`. See `DataDict.aggregations` for the supported aggregations.
+    * `Nullable`: Whether the column is converted to the nullable pandas type in `DataDict.nullable_types` such as `Int64` so that missing values
+      don't force it to `float` or `object`. Values are parsed like `bool` columns. If the value is missing, the `nullable` policy of the data dictionary applies.
+    * `Parse Format`: `strftime` format such as `%Y-%m-%d %H:%M:%S` that the strings of a `datetime64` column are parsed with instead of inferring the format.
+    * `Time Zone`: Time zone such as `Europe/London` of a `datetime64` column. Naive timestamps are localised to it and timestamps with a time zone are converted to it.
+      Naive timestamps that are ambiguous or don't exist in the time zone because of daylight saving time cannot be converted.
+    * `Unit`: Unit such as `s` or `ms` of the numbers of a `datetime64` column with epoch timestamps or of a `timedelta` column. See `DataDict.units` for the supported units.
+    * `Categories`: Categories of a `category` column separated by `|` such as `low|medium|high`. All remapped frames, chunks and partitions get the same
+      categorical type so that they can be concatenated without recoding them. Values that are not in the categories cannot be converted. If all
+      categories are numbers such as the codes `1|2|3`, the categories are numbers and string values are converted to numbers to match them.
+    * `Ordered`: Whether the `Categories` are ordered. Values are parsed like `bool` columns.
+
+    The data dictionary can either be loaded from a CSV file or from a data frame.
+    """
+
+    _data_dict_file: str
+    _data_dict_updated: float = None
+    _data_dict_checked: float = None
+    _load_lock: threading.Lock
+    _plans_lock: threading.Lock
+    _watcher: threading.Thread = None
+    _watcher_stop: threading.Event = None
+    _state: _DataDictState
+    _counters: Dict[str, float]
+
+    # Shortcuts to the current state. Operations that need a consistent view across several of them read `_state` once instead.
+    _data_dict = property(lambda self: self._state.data_dict)
+    _formats = property(lambda self: self._state.formats)
+    _names = property(lambda self: self._state.names)
+    _data_sets = property(lambda self: self._state.data_sets)
+    _specs = property(lambda self: self._state.specs)
+    _positions = property(lambda self: self._state.positions)
+    _aggregations = property(lambda self: self._state.aggregations)
+    _plans = property(lambda self: self._state.plans)
+
+    snapshot: bool
+    auto_reload: bool
+    reload_strategy: str
+    reload_interval: float
+    reload_strategies = ['interval', 'watch', 'manual']
+    column_names = ['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']
+    supported_types = ['float', 'float32', 'float64', 'int', 'int32', 'int64', 'object', 'str', 'bool', 'datetime64', 'timedelta', 'category']
+    stats = {'sum': 'Total', 'mean': 'Average'}
+    true_values = ['yes', 'true', '1']
+    aggregations = ['sum', 'mean', 'median', 'min', 'max', 'count', 'std', 'var', 'sem', 'prod', 'nunique', 'quantile', 'skew', 'any', 'all']
+    plan_cache_size: int = 128
+    snapshot_format: int = 1
+    dtype_backends = ['numpy', 'pyarrow']
+    category_threshold: float = 0.5
+    conversion_errors = ['ignore', 'coerce', 'raise']
+    failure_samples: int = 5
+    nullable: bool
+    nullable_types = {'int': 'Int64', 'int32': 'Int32', 'int64': 'Int64', 'bool': 'boolean', 'str': 'string'}
+    units = ['D', 'h', 'm', 's', 'ms', 'us', 'ns']
+    category_separator = '|'
+    pandas_types = {'float': 'float64', 'float32': 'float32', 'float64': 'float64', 'int': 'int64', 'int32': 'int32', 'int64': 'int64', 'object': 'object',
+                    'str': 'object', 'bool': 'boolean', 'datetime64': 'datetime64[ns]', 'timedelta': 'timedelta64[ns]', 'category': 'category'}
+    arrow_types = {'float': 'double', 'float32': 'float', 'float64': 'double', 'int': 'int64', 'int32': 'int32', 'int64': 'int64', 'str': 'string',
+                   'bool': 'bool', 'datetime64': 'timestamp[ns]', 'timedelta': 'duration[ns]', 'category': 'dictionary'}
+    listeners: List = []
+    meta: object
+
+    def auto_reload(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.auto_reload and self.reload_strategy == 'interval':
+                self.__load(check_interval=True)
+
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    def __aggr(self, series: pd.Series):
+        aggregation = self._aggregations.get(series.name)
+        return series.agg(aggregation.agg_func()) if aggregation is not None else None
+
+    @property
+    def data_dict(self) -> pd.DataFrame:
+        """
+        Data dictionary as a data frame.
+        """
+        return self._data_dict
+
+    @property
+    def version(self) -> str:
+        """
+        Fingerprint of the content of the data dictionary, which is calculated when the data dictionary is loaded.
+        """
+        return self._state.version
+
+    @property
+    def formats(self) -> Dict[str, str]:
+        """
+        Dictionary that maps the columns to names to their format strings.
+        """
+        return self._formats
+
+    def __init__(self, data_dict_file: str = None, auto_reload: bool = True, data_dict: pd.DataFrame = None, reload_strategy: str = 'interval',
+                 reload_interval: float = 1.0, snapshot: bool = False, nullable: bool = False):
+        """
+        Creates the data dictionary and validates it. It can either be initialised from a CSV file or a data frame.
+
+        Args:
+            data_dict_file: The data dictionary file in CSV format to use to initialise the data dictionary.
+            auto_reload: Whether the data dictionary should automatically check for changes in the data dictionary file.
+            data_dict: The data dictionary as a data frame to use to initialise the data dictionary instead of the data dictionary file.
+            reload_strategy: How changes in the data dictionary file are detected if `auto_reload` is true. With `interval`, the file is checked
+                when the data dictionary is used but at most once every `reload_interval` seconds. With `watch`, a background thread checks the file
+                every `reload_interval` seconds and swaps in the new data dictionary. With `manual`, the file is only reloaded when `reload` is called.
+            reload_interval: The minimum number of seconds between two checks of the data dictionary file.
+            snapshot: Whether to keep a binary snapshot of the validated data dictionary next to the data dictionary file (see `snapshot_file`).
+                As long as the modification time and the size of the data dictionary file match the snapshot, the data dictionary is loaded from the
+                snapshot without parsing and validating the CSV file. The snapshot is a pickle file, so its directory must be as trusted as the
+                data dictionary file itself.
+            nullable: Whether `int`, `int32`, `int64`, `bool` and `str` columns are converted to the nullable pandas types in `nullable_types` such as
+                `Int64` and `string` by default so that missing values don't force them to `float` or `object`. The `Nullable` column of the data
+                dictionary overrides it for single entries.
+        """
+        if data_dict_file is not None and data_dict is not None:
+            raise ValueError('Parameters data_dict_file and data_dict can\'t be assigned at the same time.')
+
+        if reload_strategy not in DataDict.reload_strategies:
+            raise ValueError(f'Parameter reload_strategy must be one of {DataDict.reload_strategies}.')
+
+        self._data_dict_file = data_dict_file
+        self._load_lock = threading.Lock()
+        self._plans_lock = threading.Lock()
+        self._counters = {'loads': 0, 'load_seconds': 0.0, 'plan_hits': 0, 'plan_misses': 0, 'remaps': 0, 'formats': 0}
+        self.snapshot = snapshot
+        self.auto_reload = auto_reload
+        self.reload_strategy = reload_strategy
+        self.reload_interval = reload_interval
+        self.nullable = nullable
+        self.__set_data_dict(data_dict)
+
+        self.__load()
+
+        if self.auto_reload and self.reload_strategy == 'watch' and self._data_dict_file is not None:
+            self.__start_watcher()
+
+    @property
+    def snapshot_file(self) -> str:
+        """
+        Path of the binary snapshot of the data dictionary file that is used if `snapshot` is true.
+        """
+        return None if self._data_dict_file is None else self._data_dict_file + '.snapshot'
+
+    def reload(self) -> None:
+        """
+        Reloads the data dictionary from the CSV file if the file has changed since it was last loaded.
+        """
+        self.__load()
+
+    def close(self) -> None:
+        """
+        Stops the background thread that watches the data dictionary file if the `watch` reload strategy is used.
+        """
+        if self._watcher_stop is not None:
+            self._watcher_stop.set()
+            self._watcher.join()
+            self._watcher = self._watcher_stop = None
+
+    @staticmethod
+    def add_listener(listener) -> None:
+        """
+        Registers a function that is called with a `StageTiming` after each stage of `remap`, `remap_iter`, `read_csv`, `format`, `add_stats` and
+        of loading a data dictionary, e.g. to export the timings to a metrics system. Listeners are registered for all data dictionaries.
+
+        Args:
+            listener: The function to call with the `StageTiming` of each stage.
+        """
+        DataDict.listeners.append(listener)
+
+    @staticmethod
+    def remove_listener(listener) -> None:
+        """
+        Removes a function registered with `add_listener`.
+
+        Args:
+            listener: The function to remove.
+        """
+        DataDict.listeners.remove(listener)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def profile(trace_memory: bool = False) -> Iterator[List[StageTiming]]:
+        """
+        Collects the `StageTiming` of all stages of the operations run within the context, e.g.
+
+            with DataDict.profile() as timings:
+                dd.remap(df, data_set='player')
+            print(pd.DataFrame(timings))
+
+        Args:
+            trace_memory: Whether to measure the bytes allocated by each stage with `tracemalloc`. This slows down the operations considerably.
+
+        Returns:
+            The list the timings are appended to.
+        """
+        timings = []
+        listener = timings.append
+        started = trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+
+        DataDict.add_listener(listener)
+        try:
+            yield timings
+        finally:
+            DataDict.remove_listener(listener)
+            if started:
+                tracemalloc.stop()
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Gets the cumulative counters of the data dictionary, e.g. to export them to a metrics system:
+        * `loads`: Number of times the data dictionary was loaded.
+        * `reloads`: Number of times the data dictionary was reloaded because the file changed.
+        * `load_seconds`: Total time spent reading, validating and indexing the data dictionary.
+        * `plan_hits`, `plan_misses` and `plan_hit_rate`: Lookups of the remap plan cache.
+        * `plans_cached`: Number of remap plans currently cached.
+        * `remaps` and `formats`: Number of frames remapped and formatted.
+        * `formatter_hits`, `formatter_misses` and `formatter_hit_rate`: Lookups of the compiled format strings, which are shared by all data dictionaries.
+
+        Returns:
+            The counters by name.
+        """
+        counters = dict(self._counters)
+        counters['reloads'] = max(counters['loads'] - 1, 0)
+        counters['plan_hit_rate'] = DataDict.__rate(counters['plan_hits'], counters['plan_misses'])
+        counters['plans_cached'] = len(self._plans)
+
+        formatter_info = _formatter.cache_info()
+        counters['formatter_hits'] = formatter_info.hits
+        counters['formatter_misses'] = formatter_info.misses
+        counters['formatter_hit_rate'] = DataDict.__rate(formatter_info.hits, formatter_info.misses)
+        return counters
+
+    @staticmethod
+    def __rate(hits: int, misses: int) -> float:
+        return hits / (hits + misses) if hits + misses > 0 else np.nan
+
+    def __start_watcher(self) -> None:
+        """
+        Starts the background thread that checks the data dictionary file for changes every `reload_interval` seconds. The thread only holds a weak
+        reference to the data dictionary so that it stops once the data dictionary is garbage collected.
+        """
+        def watch(dd_ref: weakref.ref, stop: threading.Event, interval: float):
+            while not stop.wait(interval):
+                dd = dd_ref()
+                if dd is None:
+                    return
+
+                try:
+                    dd.__load()
+                except Exception as e:
+                    warnings.warn(f'The data dictionary file {dd._data_dict_file} could not be reloaded.\nError message: {e}')
+                del dd
+
+        self._watcher_stop = threading.Event()
+        self._watcher = threading.Thread(target=watch, args=(weakref.ref(self), self._watcher_stop, self.reload_interval), daemon=True,
+                                         name=f'DataDict watcher for {self._data_dict_file}')
+        self._watcher.start()
+
+    def __load(self, check_interval: bool = False) -> None:
+        """
+        Loads the data dictionary from the CSV file specified during initialisation and validates it. The file is only read if it has changed.
+
+        Args:
+            check_interval: Whether to skip checking the file if it has been checked less than `reload_interval` seconds ago.
+        """
+        if self._data_dict_file is None:
+            return
+
+        now = time.monotonic()
+        if check_interval and self._data_dict_checked is not None and now - self._data_dict_checked < self.reload_interval:
+            return
+
+        with self._load_lock:
+            try:
+                stat = os.stat(self._data_dict_file)
+            except FileNotFoundError:
+                raise ValueError(f'The data dictionary file {self._data_dict_file} does not exist.')
+
+            updated = stat.st_mtime
+            self._data_dict_checked = now
+            if self._data_dict_updated is not None and updated == self._data_dict_updated:
+                return
+
+            stopwatch = _Stopwatch('load')
+            start = time.perf_counter()
+            snapshot_key = (DataDict.snapshot_format, pd.__version__, stat.st_mtime_ns, stat.st_size)
+            snapshot = self.__read_snapshot(snapshot_key) if self.snapshot else None
+            data_dict = pd.read_csv(self._data_dict_file) if snapshot is None else snapshot['data_dict']
+            self._counters['load_seconds'] += time.perf_counter() - start
+            stopwatch.lap('read', data_dict)
+
+            if snapshot is None:
+                self.__set_data_dict(data_dict)
+                if self.snapshot:
+                    self.__write_snapshot(snapshot_key)
+            else:
+                self.__set_data_dict(data_dict, version=snapshot['version'])
+            self._data_dict_updated = updated
+
+    def __read_snapshot(self, key: tuple) -> dict:
+        """
+        Reads the snapshot of the data dictionary file if it exists and matches the given key.
+
+        Args:
+            key: The key of the current data dictionary file consisting of the snapshot format, the pandas version, the modification time and the size.
+
+        Returns:
+            The snapshot with the `data_dict` and its `version` or `None` if there is no matching snapshot.
+        """
+        try:
+            with open(self.snapshot_file, 'rb') as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            warnings.warn(f'The data dictionary snapshot {self.snapshot_file} could not be read and is ignored.\nError message: {e}')
+            return None
+
+        return snapshot if isinstance(snapshot, dict) and snapshot.get('key') == key else None
+
+    def __write_snapshot(self, key: tuple) -> None:
+        """
+        Writes the snapshot of the current data dictionary. The snapshot is written to a temporary file first and then moved into place so that
+        other processes never read a partially written snapshot.
+
+        Args:
+            key: The key of the data dictionary file the data dictionary was loaded from.
+        """
+        snapshot = {'key': key, 'data_dict': self._data_dict, 'version': self.version}
+        directory = os.path.dirname(os.path.abspath(self.snapshot_file))
+        try:
+            with tempfile.NamedTemporaryFile(dir=directory, prefix='.datadict-', delete=False) as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, self.snapshot_file)
+        except OSError as e:
+            warnings.warn(f'The data dictionary snapshot {self.snapshot_file} could not be written.\nError message: {e}')
+
+    def __set_data_dict(self, data_dict: pd.DataFrame, version: str = None) -> None:
+        """
+        Sets a new data dictionary frame validates it.
+
+        Args:
+            data_dict: Specifies the data dictionary.
+            version: The fingerprint of a data dictionary that has already been validated, e.g. when it is loaded from a snapshot.
+                If specified, the data dictionary is neither validated nor fingerprinted again.
+        """
+        stopwatch = _Stopwatch('load')
+        start = time.perf_counter()
+        if version is None:
+            DataDict.validate(data_dict)
+            version = DataDict.__fingerprint(data_dict)
+
+        if data_dict is None:
+            self._state = _DataDictState(version=version, plans=OrderedDict())
+        else:
+            stopwatch.lap('validate', data_dict)
+            formats = data_dict[['Name', 'Format']].dropna(subset=['Format'])
+
+            # Everything is derived first and then published at once together with an empty plan cache.
+            self._state = _DataDictState(data_dict=data_dict, version=version, formats=pd.Series(formats['Format'].values, index=formats['Name']).to_dict(),
+                                         names=list(data_dict['Name'].values), plans=OrderedDict(), **DataDict.__build_indexes(data_dict))
+            stopwatch.lap('index', data_dict)
+
+            self._counters['loads'] += 1
+            self._counters['load_seconds'] += time.perf_counter() - start
+
+    @staticmethod
+    def __fingerprint(data_dict: pd.DataFrame) -> str:
+        """
+        Calculates a stable fingerprint of the content of the given data dictionary.
+
+        Args:
+            data_dict: The data dictionary to calculate the fingerprint for.
+
+        Returns:
+            The fingerprint as a hex string or `None` if no data dictionary is given.
+        """
+        if data_dict is None:
+            return None
+
+        digest = hashlib.sha1(str(list(data_dict.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(data_dict, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def __build_indexes(data_dict: pd.DataFrame) -> dict:
+        """
+        Builds the immutable lookup structures that map data sets to their field specifications, names to their specification and
+        names to their position in the data dictionary so that lookups don't have to query the data dictionary data frame.
+
+        Args:
+            data_dict: The data dictionary to build the lookup structures for.
+
+        Returns:
+            The `data_sets`, `specs`, `positions` and `aggregations` lookup structures.
+        """
+        aggregations = data_dict['Default Aggregation'].values if 'Default Aggregation' in data_dict.columns else [None] * len(data_dict)
+        nullables = DataDict.__parse_bool(data_dict['Nullable'].replace('', np.nan)).tolist() if 'Nullable' in data_dict.columns else [None] * len(data_dict)
+        parse_options = [[None if pd.isnull(val) or val == '' else val for val in data_dict[col].values] if col in data_dict.columns else [None] * len(data_dict)
+                         for col in ['Parse Format', 'Time Zone', 'Unit']]
+        specs = [_FieldSpec(*values) for values in zip(data_dict['Data Set'].values, data_dict['Field'].values, data_dict['Name'].values,
+                                                       data_dict['Description'].values, data_dict['Type'].values, data_dict['Format'].values,
+                                                       aggregations, [None if pd.isnull(val) else val for val in nullables], *parse_options,
+                                                       DataDict.__categorical_dtypes(data_dict))]
+
+        data_sets = {}
+        for spec in specs:
+            if not pd.isnull(spec.data_set):
+                data_sets.setdefault(spec.data_set, []).append(spec)
+
+        return {'data_sets': MappingProxyType({data_set: tuple(ds_specs) for (data_set, ds_specs) in data_sets.items()}),
+                'specs': MappingProxyType({spec.name: spec for spec in specs}),
+                'positions': MappingProxyType({spec.name: pos for (pos, spec) in enumerate(specs)}),
+                'aggregations': MappingProxyType({spec.name: _aggregation(spec.aggregation) for spec in specs if DataDict.__has_aggregation(spec.aggregation)})}
+
+    @staticmethod
+    def __categorical_dtypes(data_dict: pd.DataFrame) -> list:
+        """
+        Creates the categorical types of the entries of the given data dictionary from the optional `Categories` and `Ordered` columns.
+
+        Args:
+            data_dict: The data dictionary.
+
+        Returns:
+            The `pd.CategoricalDtype` of each entry in the order of the data dictionary or `None` if the entry has no categories.
+        """
+        if 'Categories' not in data_dict.columns:
+            return [None] * len(data_dict)
+
+        ordered = DataDict.__parse_bool(data_dict['Ordered'].replace('', np.nan)).fillna(False).values if 'Ordered' in data_dict.columns else [False] * len(data_dict)
+        return [pd.CategoricalDtype(DataDict.__parse_categories(categories), ordered=bool(is_ordered)) if isinstance(categories, str) and categories != '' else None
+                for (categories, is_ordered) in zip(data_dict['Categories'].values, ordered)]
+
+    @staticmethod
+    def __parse_categories(categories: str) -> pd.Index:
+        """
+        Parses the value of the `Categories` column. If all categories are numbers such as the codes `1|2|3`, the categories are numbers so that they
+        match numeric columns, otherwise they are strings.
+
+        Args:
+            categories: The categories separated by `DataDict.category_separator`.
+
+        Returns:
+            The categories.
+        """
+        values = pd.Index(categories.split(DataDict.category_separator))
+        numbers = pd.to_numeric(values, errors='coerce')
+        return values if numbers.isna().any() else numbers
+
+    @staticmethod
+    def __has_aggregation(expression) -> bool:
+        """
+        Checks whether the given value of the `Default Aggregation` column specifies an aggregation.
+
+        Args:
+            expression: The value of the `Default Aggregation` column.
+
+        Returns:
+            Whether an aggregation is specified.
+        """
+        return isinstance(expression, str) and expression.strip() != ''
+
+    def __data_set_specs(self, data_set: str = None, any_data_set: bool = False) -> Tuple[_FieldSpec, ...]:
+        """
+        Gets the field specifications of the data set with the given name.
+
+        Args:
+            data_set: The data set to get the specifications for. If `data_set` is not specified, the entries with empty `Data Set` are returned.
+            any_data_set: Whether to return the specifications of all data sets.
+
+        Returns:
+            The field specifications in the order of the data dictionary.
+        """
+        if any_data_set:
+            return tuple(self._specs.values())
+
+        return self._data_sets.get('' if data_set is None else data_set, ())
+
+    @staticmethod
+    def validate(data_dict: pd.DataFrame) -> None:
+        """
+        Validates the given data dictionary and raises a `ValueError` if the validation fails.
+
+        Args:
+            data_dict: The data dictionary to validate.
+
+        Returns:
+
+        Raises:
+            ValueError: If the given data dictionary is not valid.
+        """
+        if data_dict is None:
+            return
+
+        # Check that all expected columns exist.
+        if not set(data_dict.columns) >= set(DataDict.column_names):
+            raise ValueError(f'The data dictionary must at least include the following column names: {DataDict.column_names}')
+
+        # Check that all types are supported Python types.
+        if not set(data_dict['Type'].values) <= set(DataDict.supported_types):
+            raise ValueError(
+                f'The Type column of the data dictionary contains the following unsupported types {set(data_dict["Type"].values) - set(DataDict.supported_types)}. Only the following types are supported: {DataDict.supported_types}')
+
+        # Check that names are unique.
+        if any(data_dict['Name'].duplicated()):
+            raise ValueError(f'The Name column contains the following duplicates: {data_dict["Name"][data_dict["Name"].duplicated()].values}. The names must be unique.')
+
+        # Check that dataset and field combination is unique.
+        # Only the two columns are compared so that the data dictionary does not need to be copied.
+        field_ids = (data_dict['Data Set'].replace('', np.nan) + '.' + data_dict['Field'].replace('', np.nan)).dropna()
+        if any(field_ids.duplicated()):
+            raise ValueError(f'The combination of columns Data Set and Field contains the following duplicates: {field_ids[field_ids.duplicated()].values}. The combination must be unique.')
+
+        # Check that the default aggregations are supported.
+        if 'Default Aggregation' in data_dict.columns:
+            for expression in data_dict['Default Aggregation'].values:
+                if DataDict.__has_aggregation(expression):
+                    _aggregation(expression)
+
+        # Check that the parse options are only used with the types they apply to.
+        DataDict.__validate_parse_options(data_dict)
+
+        # Check that categories are only declared for category columns and are unique.
+        if 'Categories' in data_dict.columns:
+            categories = data_dict['Categories'].replace('', np.nan)
+            invalid = categories.notna() & (data_dict['Type'] != 'category')
+            if invalid.any():
+                raise ValueError(f'The Categories column can only be used with the type category but is used for {list(data_dict["Name"][invalid].values)}.')
+
+            for (name, value) in zip(data_dict['Name'].values, categories.values):
+                if isinstance(value, str) and not DataDict.__parse_categories(value).is_unique:
+                    raise ValueError(f'The Categories of {name} contain duplicates. The categories must be unique.')
+
+        if 'Ordered' in data_dict.columns:
+            ordered = data_dict['Ordered'].replace('', np.nan).notna()
+            invalid = ordered & (data_dict['Categories'].replace('', np.nan).isna() if 'Categories' in data_dict.columns else True)
+            if invalid.any():
+                raise ValueError(f'The Ordered column can only be used with the Categories column but is used without categories for {list(data_dict["Name"][invalid].values)}.')
+
+    @staticmethod
+    def __validate_parse_options(data_dict: pd.DataFrame) -> None:
+        """
+        Validates the optional `Parse Format`, `Time Zone` and `Unit` columns of the given data dictionary.
+
+        Args:
+            data_dict: The data dictionary to validate.
+
+        Raises:
+            ValueError: If an option is used with a type it does not apply to or if a time zone or unit is not supported.
+        """
+        options = {col: data_dict[col].replace('', np.nan) for col in ['Parse Format', 'Time Zone', 'Unit'] if col in data_dict.columns}
+        for (col, types) in [('Parse Format', ['datetime64']), ('Time Zone', ['datetime64']), ('Unit', ['datetime64', 'timedelta'])]:
+            if col in options:
+                invalid = options[col].notna() & ~data_dict['Type'].isin(types)
+                if invalid.any():
+                    raise ValueError(f'The {col} column can only be used with the types {types} but is used for {list(data_dict["Name"][invalid].values)}.')
+
+        if 'Parse Format' in options and 'Unit' in options:
+            both = options['Parse Format'].notna() & options['Unit'].notna()
+            if both.any():
+                raise ValueError(f'The Parse Format and Unit columns cannot both be used for {list(data_dict["Name"][both].values)}.')
+
+        if 'Unit' in options:
+            units = set(options['Unit'].dropna().values)
+            if not units <= set(DataDict.units):
+                raise ValueError(f'The Unit column contains the following unsupported units {units - set(DataDict.units)}. Only the following units are supported: {DataDict.units}')
+
+        if 'Time Zone' in options:
+            for tz in set(options['Time Zone'].dropna().values):
+                try:
+                    pd.DatetimeTZDtype(tz=tz)
+                except Exception:
+                    raise ValueError(f'The Time Zone column contains the unknown time zone {tz}.')
+
+    def __is_nullable(self, spec: _FieldSpec) -> bool:
+        """
+        Checks whether the column of the given data dictionary entry is converted to its nullable pandas type based on the `Nullable` column
+        of the entry and the `nullable` policy of the data dictionary.
+
+        Args:
+            spec: The data dictionary entry.
+
+        Returns:
+            Whether the column is converted to its nullable pandas type.
+        """
+        return spec.type in DataDict.nullable_types and (self.nullable if spec.nullable is None else spec.nullable)
+
+    @staticmethod
+    def __pandas_type(typ: str, nullable: bool = False) -> str:
+        """
+        Gets the pandas type that columns of the given data dictionary type are converted to.
+
+        Args:
+            typ: The type in the `Type` column of the data dictionary.
+            nullable: Whether to use the nullable pandas type if there is one.
+
+        Returns:
+            The pandas type.
+        """
+        return DataDict.nullable_types[typ] if nullable and typ in DataDict.nullable_types else DataDict.pandas_types[typ]
+
+    @staticmethod
+    def __is_type(dtype, typ: str, nullable: bool = False, time_zone: str = None) -> bool:
+        """
+        Checks whether the given data type already is the given data dictionary type so that no conversion is necessary.
+
+        Args:
+            dtype: The data type of the column.
+            typ: The type in the `Type` column of the data dictionary.
+            nullable: Whether the column is converted to the nullable pandas type of the type.
+            time_zone: The time zone of `datetime64` columns.
+
+        Returns:
+            Whether the data type matches the type.
+        """
+        if typ == 'datetime64':
+            return is_datetime64_dtype(dtype) if time_zone is None else is_dtype_equal(dtype, pd.DatetimeTZDtype(tz=time_zone))
+
+        return is_dtype_equal(dtype, DataDict.nullable_types[typ] if nullable and typ in DataDict.nullable_types else typ)
+
+    @staticmethod
+    def __has_categories(dtype, categories: pd.CategoricalDtype) -> bool:
+        """
+        Checks whether the given data type has exactly the given categories in the same order so that the codes of the values are the same.
+
+        Args:
+            dtype: The data type of the column.
+            categories: The declared categorical type.
+
+        Returns:
+            Whether the data type has the given categories.
+        """
+        return is_categorical_dtype(dtype) and dtype.ordered == categories.ordered and dtype.categories.equals(categories.categories)
+
+    @staticmethod
+    def __may_contain_str(dtype) -> bool:
+        """
+        Checks whether a column with the given data type can contain strings.
+
+        Args:
+            dtype: The data type of the column.
+
+        Returns:
+            Whether the column can contain strings.
+        """
+        return is_object_dtype(dtype) or is_string_dtype(dtype) or is_categorical_dtype(dtype)
+
+    @staticmethod
+    def __blank_mask(col: pd.Series) -> np.ndarray:
+        """
+        Gets the mask of the values in the given column that are empty strings.
+
+        Args:
+            col: The column to check.
+
+        Returns:
+            The mask that is `True` for empty strings.
+        """
+        if is_object_dtype(col.dtype):
+            try:
+                return np.equal(col.values, '')
+            except (TypeError, ValueError):  # Some values like pd.NA cannot be compared by NumPy, so pandas needs to do the comparison.
+                pass
+
+        return col.eq('').fillna(False).values.astype(bool)
+
+    @staticmethod
+    def __normalise_str(col: pd.Series) -> pd.Series:
+        """
+        Converts all values of the given column that are not strings or that are empty strings to `None`. Columns that only contain strings
+        are handled with vectorised operations. The type of each value is only checked for columns with mixed types.
+
+        Args:
+            col: The column to normalise.
+
+        Returns:
+            The normalised column.
+        """
+        if not DataDict.__may_contain_str(col.dtype):
+            return pd.Series(None, index=col.index, name=col.name, dtype=object)
+
+        keep = ~DataDict.__blank_mask(col)
+        if pd.api.types.infer_dtype(col, skipna=True) not in ['string', 'empty']:
+            keep &= np.fromiter((isinstance(val, str) for val in col.values), dtype=bool, count=len(col))
+
+        return col if keep.all() else col.where(keep, None)
+
+    @staticmethod
+    def __blank_to_nan(col: pd.Series) -> pd.Series:
+        """
+        Replaces the empty strings in the given column with `nan` and infers the type of the column if any value was replaced.
+
+        Args:
+            col: The column to replace the empty strings in.
+
+        Returns:
+            The column without empty strings.
+        """
+        if is_categorical_dtype(col.dtype):
+            return col.cat.remove_categories(['']) if '' in col.cat.categories else col
+
+        blank = DataDict.__blank_mask(col)
+        if not blank.any():
+            return col
+
+        col = col.mask(blank)
+        return col.infer_objects() if is_object_dtype(col.dtype) else col
+
+    @staticmethod
+    def __parse_bool(col: pd.Series) -> pd.Series:
+        """
+        Converts the given column to the nullable `boolean` type. Strings are considered `True` if they are in `DataDict.true_values`
+        ignoring the case, the rest is considered `False`. Other values are converted based on their truth value and missing values remain missing.
+        Each distinct value is only parsed once.
+
+        Args:
+            col: The column to convert.
+
+        Returns:
+            The converted column.
+        """
+        if is_bool_dtype(col.dtype):
+            return col.astype('boolean')
+
+        codes, uniques = pd.factorize(col.values)
+        parsed = np.array([val.lower() in DataDict.true_values if isinstance(val, str) else bool(val) for val in uniques] + [False], dtype=bool)
+
+        # The code of missing values is -1 and therefore points to the False appended at the end.
+        values = parsed[codes]
+        missing = codes == -1
+        return pd.Series(pd.arrays.BooleanArray(values, missing), index=col.index, name=col.name)
+
+    @staticmethod
+    def __is_arrow(dtype) -> bool:
+        """
+        Checks whether the given data type is an Arrow-backed data type.
+
+        Args:
+            dtype: The data type of the column.
+
+        Returns:
+            Whether the column is backed by an Arrow array.
+        """
+        return hasattr(pd, 'ArrowDtype') and isinstance(dtype, pd.ArrowDtype)
+
+    @staticmethod
+    def __to_arrow(col: pd.Series, typ: str) -> pd.Series:
+        """
+        Converts the given column to the Arrow type of the given data dictionary type. Arrow-backed columns are converted with Arrow compute functions
+        and are returned as they are if they already have the right type. Columns that cannot be converted are returned unchanged with a warning.
+
+        Args:
+            col: The column to convert.
+            typ: The type in the `Type` column of the data dictionary.
+
+        Returns:
+            The column backed by an Arrow array.
+        """
+        pa = _pyarrow()
+        import pyarrow.compute as pc
+
+        # Categories are dictionary encoded with the type of their categories and timestamps keep the time zone they have been converted to.
+        arrow_type = None if typ == 'category' else pa.type_for_alias(DataDict.arrow_types[typ])
+        if isinstance(col.dtype, pd.DatetimeTZDtype):
+            arrow_type = pa.timestamp('ns', tz=str(col.dtype.tz))
+        try:
+            original = None
+            if not DataDict.__is_arrow(col.dtype):
+                array = pa.array(col.array if typ == 'category' else col, type=arrow_type, from_pandas=True)
+            else:
+                original = array = col.array.__arrow_array__()
+                if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+                    if pc.any(pc.equal(array, '')).as_py():
+                        array = pc.if_else(pc.equal(array, ''), pa.scalar(None, array.type), array)
+
+                    if typ == 'bool':
+                        parsed = pc.is_in(pc.utf8_lower(array), value_set=pa.array(DataDict.true_values))
+                        array = pc.if_else(pc.is_null(array), pa.scalar(None, pa.bool_()), parsed)
+
+                if typ == 'category':
+                    array = array if pa.types.is_dictionary(array.type) else array.dictionary_encode()
+                elif array.type != arrow_type:
+                    array = array.cast(arrow_type)
+
+            # Categories always have 32-bit indices so that the type does not depend on the number of categories.
+            if typ == 'category' and array.type.index_type != pa.int32():
+                array = array.cast(pa.dictionary(pa.int32(), array.type.value_type))
+
+            if array is original:
+                return col
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            warnings.warn(f'Column {col.name} could not be converted to the Arrow type of {typ}.\nError message: {e}')
+            return col
+
+        return pd.Series(pd.arrays.ArrowExtensionArray(array), index=col.index, name=col.name)
+
+    def df(self, data_set: str = None, any_data_set: bool = False) -> pd.DataFrame:
+        """
+        Gets the data set with the given name as a data frame.
+
+        Args:
+            data_set: The data set to filter by. If this value matches a value in the `Data Set` column of the data dictionary, the matching rows are returned.
+            If `data_set` is not specified, the entries with empty `Data Set` are returned.
+            any_data_set: Whether to return all data sets in the data frame.
+
+        Returns:
+            The data set as a data frame, index by the `Field` column.
+        """
+        if any_data_set and data_set is not None:
+            raise ValueError('Either data_set can be provided or any_data_set can be True but not both.')
+
+        rows = [self._positions[spec.name] for spec in self.__data_set_specs(data_set, any_data_set)]
+        return self._data_dict.iloc[rows].set_index('Field')
+
+    @auto_reload
+    def remap(self, df: pd.DataFrame, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False, dtype_backend: str = 'numpy',
+              optimise: bool = False, errors: str = 'ignore', copy: bool = True) -> pd.DataFrame:
+        """
+        Renames the columns in the given data frame based on based on the `Data Set` and `Field` attributes in the data dictionary to `Name`
+        if such a mapping found and converts the columns data to `Type`. It also reorders the columns based on the order of the data dictionary entries.
+
+        Args:
+            df: The data frame to remap.
+            data_set: The data set to use. If this value matches a value in the `Data Set` column of the data dictionary, then the corresponding names in the `Field`
+                column are used to rename the columns of the given data frame to the `Name` column name. If `dataset` is not specified, the values in `Field` column
+                that have entries with empty `Data Set` are used.
+            ensure_cols: Ensures all columns in the data_set are present. If the source data frame does not contain them, empty ones are created. This parameter can
+                only be true if data_set is specified. This is useful when the data frame to be remapped may not have all the columns if it is empty.
+            strip_cols: Whether to remove all columns that are not in the data set. In any case, it will leave the index untouched.
+            dtype_backend: The backend of the data types of the data set columns. With `numpy`, the columns are converted to NumPy types like `int64`
+                and `object`. With `pyarrow`, they are converted to `pd.ArrowDtype` types based on `DataDict.arrow_types`, e.g. `str` columns are
+                stored as Arrow strings instead of Python objects. Columns that are already Arrow-backed are not copied if their type matches.
+                This requires `pyarrow`.
+            optimise: Whether to reduce the memory usage of the remapped data frame with `optimise`.
+            errors: How to handle values that cannot be converted to the `Type` of their column. Each column is converted separately, so values
+                that cannot be converted only affect their own column. With `ignore`, the column is left unconverted. With `coerce`, the values are
+                replaced with missing values, which converts `int` columns to `float64`. With `raise`, a `ValueError` is raised. Missing values in `int`
+                columns also count as values that cannot be converted. If any values cannot be converted, the number of values and samples of them
+                are attached to the remapped data frame in the `conversion_report` attribute.
+            copy: Whether the remapped data frame must not share memory with the given data frame. If false, the remapped data frame is assembled
+                once from the converted columns and the columns that don't need to be converted are passed through by reference instead of being
+                copied by the renaming and the reordering, so the peak memory stays close to the size of the given data frame. Modifying these columns
+                in place also modifies the given data frame. The column names of the given data frame must be unique.
+
+        Returns:
+            The remapped data frame.
+        """
+        if df is None:
+            raise ValueError('Parameter df not provided.')
+
+        DataDict.__check_options(dtype_backend, errors)
+
+        if not copy and not df.columns.is_unique:
+            raise ValueError('Parameter copy can only be false if the column names of the data frame are unique.')
+
+        if (data_set is None or data_set == '') and ensure_cols:
+            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
+
+        stopwatch = _Stopwatch('remap')
+        df = self.__apply_plan(df, self.__plan(df, data_set, ensure_cols, strip_cols, dtype_backend), stopwatch, errors, copy)
+        return self.optimise(df) if optimise else df
+
+    @auto_reload
+    def optimise(self, df: pd.DataFrame, category_threshold: float = None) -> pd.DataFrame:
+        """
+        Reduces the memory usage of the columns of the given remapped data frame that are in the data dictionary. Integer columns are downcast to the
+        smallest integer type that can hold their values and float columns to `float32` if their values can be represented within its precision.
+        `str` columns are converted to `category` if they have few distinct values. Arrow-backed columns are not changed.
+
+        The memory usage of each data dictionary column before and after is attached to the returned data frame in the `memory_report` attribute.
+        It shows the types the `Type` column of the data dictionary could be changed to. As the types depend on the values, the columns of different
+        data frames can end up with different types.
+
+        Args:
+            df: The data frame to optimise.
+            category_threshold: The maximum ratio of distinct values to rows for `str` columns to be converted to `category`. If not specified,
+                `DataDict.category_threshold` is used.
+
+        Returns:
+            The optimised data frame with the `memory_report` attribute.
+        """
+        if df is None:
+            raise ValueError('Parameter df is mandatory')
+
+        category_threshold = self.category_threshold if category_threshold is None else category_threshold
+        stopwatch = _Stopwatch('optimise')
+        df = df.copy(deep=False)
+
+        report = []
+        for col in df.columns:
+            spec = self._specs.get(col)
+            if spec is None:
+                continue
+
+            before = df[col]
+            after = DataDict.__optimise_col(before, spec.type, category_threshold)
+            if after is not before:
+                df[col] = after
+
+            report.append((col, spec.type, str(before.dtype), str(after.dtype), before.memory_usage(index=False, deep=True),
+                           after.memory_usage(index=False, deep=True)))
+
+        DataDict.__set_attr(df, 'memory_report', pd.DataFrame(report, columns=['Name', 'Type', 'Type Before', 'Type After', 'Bytes Before', 'Bytes After'])
+                            .set_index('Name'))
+        stopwatch.lap('optimise', df)
+        return df
+
+    @staticmethod
+    def __optimise_col(col: pd.Series, typ: str, category_threshold: float) -> pd.Series:
+        """
+        Converts the given column to the most memory efficient type that can hold its values.
+
+        Args:
+            col: The column to optimise.
+            typ: The type in the `Type` column of the data dictionary.
+            category_threshold: The maximum ratio of distinct values to rows for `str` columns to be converted to `category`.
+
+        Returns:
+            The optimised column or the given column if it cannot be optimised.
+        """
+        if DataDict.__is_arrow(col.dtype) or is_bool_dtype(col.dtype):
+            return col
+
+        if is_integer_dtype(col.dtype):
+            return pd.to_numeric(col, downcast='integer')
+
+        if is_float_dtype(col.dtype):
+            return pd.to_numeric(col, downcast='float')
+
+        if typ == 'str' and is_object_dtype(col.dtype) and len(col) > 0 and col.nunique() <= category_threshold * len(col):
+            return col.astype('category')
+
+        return col
+
+    @auto_reload
+    def remap_table(self, df: pd.DataFrame, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False, preserve_index: bool = None):
+        """
+        Remaps the given data frame like `remap` with the `pyarrow` dtype backend does and returns the result as a `pyarrow.Table`. The Arrow arrays
+        of the remapped columns are passed to the table without copying them.
+
+        Args:
+            df: The data frame to remap.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to remove all columns that are not in the data set. See `remap` for details.
+            preserve_index: Whether to store the index as columns of the table. See `pyarrow.Table.from_pandas` for details.
+
+        Returns:
+            The remapped table.
+        """
+        pa = _pyarrow()
+        return pa.Table.from_pandas(self.remap(df, data_set, ensure_cols, strip_cols, dtype_backend='pyarrow'), preserve_index=preserve_index)
+
+    @auto_reload
+    def arrow_schema(self, data_set: str = None, any_data_set: bool = False):
+        """
+        Gets the Arrow schema of the given data set with a field for each `Name` and its `Type` based on `DataDict.arrow_types`. The `Description`
+        and the `Format` are stored in the metadata of the fields. Columns with type `object` are not included because they have no Arrow type.
+
+        Args:
+            data_set: The data set to get the schema for. If `data_set` is not specified, the entries with empty `Data Set` are used.
+            any_data_set: Whether to include the columns of all data sets.
+
+        Returns:
+            The `pyarrow.Schema` of the data set.
+        """
+        pa = _pyarrow()
+        return pa.schema([self.__arrow_field(spec) for spec in self.__data_set_specs(data_set, any_data_set) if spec.type != 'object'],
+                         metadata={'datadict.version': self.version})
+
+    @staticmethod
+    def __arrow_field(spec: _FieldSpec, arrow_type=None):
+        """
+        Creates the Arrow field for the given field specification.
+
+        Args:
+            spec: The field specification.
+            arrow_type: The type of the field. If not specified, the type is derived from the `Type` of the field specification.
+
+        Returns:
+            The `pyarrow.Field` with the `Description` and the `Format` as metadata.
+        """
+        pa = _pyarrow()
+        if arrow_type is None:
+            arrow_type = DataDict.__arrow_type(spec.type, spec.time_zone, spec.categories)
+
+        metadata = {key: value for (key, value) in [('description', spec.description), ('format', spec.format)] if isinstance(value, str) and value != ''}
+        return pa.field(spec.name, arrow_type, metadata=metadata)
+
+    @auto_reload
+    def to_parquet(self, df: pd.DataFrame, path, data_set: str = None, **kwargs) -> None:
+        """
+        Writes the given remapped data frame to a Parquet file. The columns in the data dictionary are written with the Arrow type of their `Type`
+        (see `arrow_schema`) and with their `Description` and `Format` as field metadata. The version of the data dictionary is stored in the file
+        so that `read_parquet` does not need to convert the columns again. This requires `pyarrow`.
+
+        Args:
+            df: The remapped data frame to write.
+            path: The path of the Parquet file. See `pyarrow.parquet.write_table` for details.
+            data_set: The data set the data frame has been remapped with. It is stored in the metadata of the file.
+            **kwargs: Additional arguments to pass to `pyarrow.parquet.write_table`.
+        """
+        if df is None:
+            raise ValueError('Parameter df is mandatory')
+
+        pa = _pyarrow()
+        import pyarrow.parquet as pq
+
+        table = self.__cast_table(pa.Table.from_pandas(df))
+        metadata = {**(table.schema.metadata or {}), b'datadict.version': self.version.encode(), b'datadict.data_set': (data_set or '').encode()}
+        pq.write_table(table.replace_schema_metadata(metadata), path, **kwargs)
+
+    @auto_reload
+    def read_parquet(self, path, data_set: str = None, columns: list = None, dtype_backend: str = 'numpy', **kwargs) -> pd.DataFrame:
+        """
+        Reads the given columns of a Parquet file. Only the given columns are read from the file. Files written by `to_parquet` with the same data dictionary
+        version are returned as they are. If the data dictionary has changed since, the columns are converted to their current `Type`. Other files are
+        remapped like `remap` does. This requires `pyarrow`.
+
+        Args:
+            path: The path of the Parquet file. See `pyarrow.parquet.read_table` for details.
+            data_set: The data set to remap files with that have not been written by `to_parquet`. See `remap` for details.
+            columns: The names of the columns to read. If not specified, all columns are read.
+            dtype_backend: The backend of the data types of the columns. See `remap` for details.
+            **kwargs: Additional arguments to pass to `pyarrow.parquet.read_table`.
+
+        Returns:
+            The data frame.
+        """
+        DataDict.__check_options(dtype_backend)
+        pa = _pyarrow()
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_schema(path).metadata or {}
+        types_mapper = pd.ArrowDtype if dtype_backend == 'pyarrow' else None
+
+        # Files that have not been written by to_parquet contain the fields of the data set, so the names are mapped back to fields.
+        if b'datadict.version' not in metadata:
+            fields = {spec.name: spec.field for spec in self.__data_set_specs(data_set)}
+            table = pq.read_table(path, columns=[fields.get(col, col) for col in columns] if columns is not None else None, **kwargs)
+            return self.remap(table.to_pandas(types_mapper=types_mapper), data_set, dtype_backend=dtype_backend)
+
+        table = pq.read_table(path, columns=columns, **kwargs)
+        if metadata[b'datadict.version'].decode() != self.version:
+            table = self.__cast_table(table)
+
+        return table.to_pandas(types_mapper=types_mapper)
+
+    def __cast_table(self, table):
+        """
+        Converts the columns of the given Arrow table to the Arrow types of their current `Type` in the data dictionary and adds the `Description`
+        and the `Format` to their field metadata. Columns that already have the right type are not copied. It warns if a column cannot be converted.
+
+        Args:
+            table: The `pyarrow.Table` to convert.
+
+        Returns:
+            The converted table.
+        """
+        pa = _pyarrow()
+        for (i, name) in enumerate(table.column_names):
+            spec = self._specs.get(name)
+            if spec is None or spec.type == 'object':
+                continue
+
+            field = self.__arrow_field(spec)
+            column = table.column(i)
+            if column.type != field.type and not (spec.type == 'category' and pa.types.is_dictionary(column.type)):
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowException, TypeError, ValueError) as e:
+                    warnings.warn(f'Column {name} could not be converted to the Arrow type of {spec.type}.\nError message: {e}')
+
+            table = table.set_column(i, field.with_type(column.type), column)
+
+        return table
+
+    @auto_reload
+    def remap_dask(self, ddf, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False, dtype_backend: str = 'numpy', errors: str = 'ignore'):
+        """
+        Remaps the partitions of the given Dask data frame like `remap` does. The names, types and order of the remapped columns are derived from
+        the data dictionary and the columns of the Dask data frame, so Dask does not need to compute a partition to infer them. The remapped
+        partitions are converted to these types like the chunks of `remap_iter`, e.g. a partition of an `int` column with a missing value cannot
+        be converted to `int64`, so it warns or raises if `errors` is `raise`. Use `nullable=True` to convert such columns to `Int64` instead.
+        This requires `dask`.
+
+        Args:
+            ddf: The `dask.dataframe.DataFrame` to remap.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to remove all columns that are not in the data set. See `remap` for details.
+            dtype_backend: The backend of the data types of the data set columns. See `remap` for details.
+            errors: How to handle values that cannot be converted. See `remap` for details.
+
+        Returns:
+            The lazily remapped `dask.dataframe.DataFrame`.
+        """
+        if ddf is None:
+            raise ValueError('Parameter ddf not provided.')
+
+        if (data_set is None or data_set == '') and ensure_cols:
+            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
+
+        DataDict.__check_options(dtype_backend, errors)
+        _dask_dataframe()
+
+        meta = self.__remap_meta(ddf._meta, data_set, ensure_cols, strip_cols, dtype_backend)
+        return ddf.map_partitions(self.__remap_partition, meta.dtypes.to_dict(), data_set, ensure_cols, strip_cols, dtype_backend, errors, meta=meta)
+
+    def __remap_partition(self, df: pd.DataFrame, dtypes: Dict[str, object], data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str,
+                          errors: str) -> pd.DataFrame:
+        """
+        Remaps the given partition for `remap_dask` and converts its columns to the types of the Dask meta data frame so that Dask works with the
+        types it has been given.
+
+        Args:
+            df: The partition to remap.
+            dtypes: The column types of the Dask meta data frame. They are passed as a dictionary because Dask would align a series with the partitions.
+            data_set: The data set to use.
+            ensure_cols: Whether to ensure all columns of the data set are present.
+            strip_cols: Whether to remove all columns that are not in the data set.
+            dtype_backend: The backend of the data types of the data set columns.
+            errors: How to handle values that cannot be converted.
+
+        Returns:
+            The remapped partition.
+        """
+        return self.__align_dtypes(self.remap(df, data_set, ensure_cols, strip_cols, dtype_backend, errors=errors), pd.Series(dtypes, dtype=object), errors)
+
+    @auto_reload
+    def read_csv_dask(self, urlpath, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False, dtype_backend: str = 'numpy',
+                      errors: str = 'ignore', **kwargs):
+        """
+        Reads the given CSV files with `dask.dataframe.read_csv` and remaps them with `remap_dask`. The types of the data set are passed to the CSV
+        parser like `read_csv` does and, if `strip_cols` is true, only the columns of the data set are parsed. This requires `dask`.
+
+        Args:
+            urlpath: The CSV files to read. See `dask.dataframe.read_csv` for details.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to only read the columns that are in the data set.
+            dtype_backend: The backend of the data types of the data set columns. See `remap` for details.
+            errors: How to handle values that cannot be converted. See `remap` for details.
+            **kwargs: Additional arguments to pass to `dask.dataframe.read_csv`. A `dtype` dictionary is merged with the types derived from the data dictionary.
+
+        Returns:
+            The lazily remapped `dask.dataframe.DataFrame`.
+        """
+        csv_args = self.__csv_args(data_set, strip_cols, errors)
+        if isinstance(kwargs.get('dtype'), dict):
+            kwargs['dtype'] = {**csv_args['dtype'], **kwargs['dtype']}
+
+        ddf = _dask_dataframe().read_csv(urlpath, **{**csv_args, **kwargs})
+        return self.remap_dask(ddf, data_set, ensure_cols, strip_cols, dtype_backend, errors)
+
+    @auto_reload
+    def read_parquet_dask(self, path, data_set: str = None, columns: list = None, dtype_backend: str = 'numpy', **kwargs):
+        """
+        Reads the given columns of the given Parquet files with `dask.dataframe.read_parquet` so that only these columns are read. Files written by
+        `to_parquet` with the same data dictionary version are returned as they are. If the data dictionary has changed since, the columns are
+        converted to their current `Type` like `read_parquet` does. Other files are remapped with `remap_dask`. This requires `dask` and `pyarrow`.
+
+        Args:
+            path: The Parquet files to read. See `dask.dataframe.read_parquet` for details.
+            data_set: The data set to remap files with that have not been written by `to_parquet`. See `remap` for details.
+            columns: The names of the columns to read. If not specified, all columns are read.
+            dtype_backend: The backend of the data types of the columns. See `remap` for details.
+            **kwargs: Additional arguments to pass to `dask.dataframe.read_parquet`.
+
+        Returns:
+            The lazily remapped `dask.dataframe.DataFrame`.
+        """
+        dask_dataframe = _dask_dataframe()
+        _pyarrow()
+        import pyarrow.dataset as pa_dataset
+        from fsspec.core import get_fs_token_paths
+
+        # Only the schema is read to find out whether the files have been written by to_parquet like read_parquet does.
+        (fs, _, paths) = get_fs_token_paths(path, storage_options=kwargs.get('storage_options'))
+        metadata = pa_dataset.dataset(paths[0] if len(paths) == 1 else paths, filesystem=fs, format='parquet').schema.metadata or {}
+
+        # Files that have not been written by to_parquet contain the fields of the data set, so the names are mapped back to fields.
+        if b'datadict.version' not in metadata:
+            fields = {spec.name: spec.field for spec in self.__data_set_specs(data_set)}
+            ddf = dask_dataframe.read_parquet(path, columns=[fields.get(col, col) for col in columns] if columns is not None else None, **kwargs)
+            return self.remap_dask(ddf, data_set, dtype_backend=dtype_backend)
+
+        ddf = dask_dataframe.read_parquet(path, columns=columns, **kwargs)
+        if metadata[b'datadict.version'].decode() != self.version:
+            ddf = ddf.map_partitions(self.__cast_partition, meta=self.__cast_partition(ddf._meta))
+
+        return ddf
+
+    def __cast_partition(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the columns of the given partition of Parquet files written by `to_parquet` to the Arrow types of their current `Type` in the
+        data dictionary like `__cast_table` does.
+
+        Args:
+            df: The partition to convert.
+
+        Returns:
+            The converted partition.
+        """
+        pa = _pyarrow()
+        return self.__cast_table(pa.Table.from_pandas(df, preserve_index=True)).to_pandas()
+
+    def __remap_meta(self, df: pd.DataFrame, data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str) -> pd.DataFrame:
+        """
+        Creates the empty data frame with the columns and types that `remap` returns for data frames with the columns and types of the given data frame.
+        The types of the data set columns are derived from their `Type` in the data dictionary. Columns added by `ensure_cols` are empty and
+        therefore have type `float64`.
+
+        Args:
+            df: The empty data frame with the columns and types of the data frame to remap.
+            data_set: The data set to use.
+            ensure_cols: Whether to ensure all columns of the data set are present.
+            strip_cols: Whether to remove all columns that are not in the data set.
+            dtype_backend: The backend of the data types of the data set columns.
+
+        Returns:
+            The empty remapped data frame.
+        """
+        plan = self.__plan(df.iloc[:0], data_set, ensure_cols, strip_cols, dtype_backend)
+        fields = {name: field for (field, name) in plan.columns_map.items()}
+        missing_cols = set(plan.missing_cols)
+
+        dtypes = {}
+        for col in plan.columns:
+            if col in missing_cols:
+                dtypes[col] = np.dtype('float64')
+            elif col in fields:
+                spec = self._specs[col]
+                if spec.type == 'object':
+                    dtypes[col] = df.dtypes[fields[col]]
+                elif spec.categories is not None and dtype_backend != 'pyarrow':
+                    dtypes[col] = spec.categories
+                else:
+                    dtypes[col] = self.__dtype(spec.type, dtype_backend, self.__is_nullable(spec), spec.time_zone, spec.categories)
+            else:
+                dtypes[col] = df.dtypes[col]
+
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for (col, dtype) in dtypes.items()}, columns=plan.columns, index=df.index[:0])
+
+    @staticmethod
+    def __dtype(typ: str, dtype_backend: str, nullable: bool = False, time_zone: str = None, categories: pd.CategoricalDtype = None):
+        """
+        Gets the pandas data type that `remap` converts columns of the given data dictionary type to.
+
+        Args:
+            typ: The type in the `Type` column of the data dictionary.
+            dtype_backend: The backend of the data type.
+            nullable: Whether the column is converted to the nullable pandas type of the type.
+            time_zone: The time zone of `datetime64` columns.
+            categories: The declared categories of `category` columns.
 
-    The data dictionary can either be loaded from a CSV file or from a data frame.
-    """
+        Returns:
+            The pandas data type.
+        """
+        if dtype_backend != 'pyarrow':
+            if typ == 'datetime64' and time_zone is not None:
+                return pd.DatetimeTZDtype(tz=time_zone)
 
-    _data_dict_file: str
-    _data_dict_updated: float = None
-    _data_dict: pd.DataFrame
-    _formats: dict
-    _names: list
+            return pd.api.types.pandas_dtype(DataDict.__pandas_type(typ, nullable))
 
-    auto_reload: bool
-    column_names = ['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']
-    supported_types = ['float', 'float32', 'float64', 'int', 'int32', 'int64', 'object', 'str', 'bool', 'datetime64', 'timedelta', 'category']
-    stats = {'sum': 'Total', 'mean': 'Average'}
-    meta: object
+        return pd.ArrowDtype(DataDict.__arrow_type(typ, time_zone, categories))
 
-    def auto_reload(func):
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            if self.auto_reload:
-                self.__load()
+    @staticmethod
+    def __arrow_type(typ: str, time_zone: str = None, categories: pd.CategoricalDtype = None):
+        """
+        Gets the Arrow type of the given data dictionary type.
 
-            return func(self, *args, **kwargs)
+        Args:
+            typ: The type in the `Type` column of the data dictionary.
+            time_zone: The time zone of `datetime64` columns.
+            categories: The declared categories of `category` columns. The values of the dictionary have the type of the categories, e.g. `int64`
+                for numeric categories. Without declared categories, the values are strings.
 
-        return wrapper
+        Returns:
+            The `pyarrow.DataType`.
+        """
+        pa = _pyarrow()
+        if typ == 'category':
+            if categories is None:
+                return pa.dictionary(pa.int32(), pa.string())
 
-    def __aggr(self, series: pd.Series):
-        funcs = self._data_dict[self._data_dict['Name'] == series.name]['Default Aggregation'].values
-        try:
-            return eval('series.' + funcs[0]) if len(funcs) == 1 and not funcs[0].isspace() else None
-        except:
-            return None
+            return pa.dictionary(pa.int32(), pa.array(categories.categories).type)
 
-    @property
-    def data_dict(self) -> pd.DataFrame:
+        if typ == 'datetime64' and time_zone is not None:
+            return pa.timestamp('ns', tz=time_zone)
+
+        return pa.type_for_alias(DataDict.arrow_types[typ])
+
+    @staticmethod
+    def __check_options(dtype_backend: str, errors: str = 'ignore') -> None:
         """
-        Data dictionary as a data frame.
+        Checks that the given dtype backend and error handling are supported and that the dependencies of the dtype backend are installed.
+
+        Args:
+            dtype_backend: The dtype backend to check.
+            errors: The error handling to check.
         """
-        return self._data_dict
+        if errors not in DataDict.conversion_errors:
+            raise ValueError(f'Parameter errors must be one of {DataDict.conversion_errors}.')
 
-    @property
-    def formats(self) -> Dict[str, str]:
+        if dtype_backend not in DataDict.dtype_backends:
+            raise ValueError(f'Parameter dtype_backend must be one of {DataDict.dtype_backends}.')
+
+        if dtype_backend == 'pyarrow':
+            _pyarrow()
+
+    @auto_reload
+    def remap_iter(self, chunks: Iterable[pd.DataFrame], data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False,
+                   dtype_backend: str = 'numpy', errors: str = 'ignore') -> Iterator[pd.DataFrame]:
         """
-        Dictionary that maps the columns to names to their format strings.
+        Remaps the given data frame chunks one by one like `remap` does. This allows to remap data that does not fit into memory, e.g. the
+        chunks returned by `pd.read_csv(..., chunksize=...)`. The remap plan is only compiled once and all chunks are converted to the column types
+        of the first remapped chunk so that they can be concatenated.
+
+        A chunk is only converted to the column types of the first chunk if no values are lost, e.g. an `int` column of a first chunk without
+        missing values is `int64`, so a later chunk with a missing value or a float with a fraction in that column keeps its own type, and a
+        `category` column without `Categories` keeps its own categories if a later chunk has values that are not in the first chunk. The data
+        dictionary warns about such columns or raises if `errors` is `raise`. Use `nullable=True` or the `Nullable` column of the data dictionary
+        to convert `int`, `bool` and `str` columns to the same nullable type in every chunk.
+
+        Args:
+            chunks: The data frame chunks to remap.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to remove all columns that are not in the data set. See `remap` for details.
+            dtype_backend: The backend of the data types of the data set columns. See `remap` for details.
+            errors: How to handle values that cannot be converted. See `remap` for details. If `raise`, a chunk that cannot be converted to the
+                column types of the first chunk raises as well.
+
+        Returns:
+            An iterator over the remapped data frame chunks.
         """
-        return self._formats
+        if chunks is None:
+            raise ValueError('Parameter chunks not provided.')
+
+        DataDict.__check_options(dtype_backend, errors)
+
+        if (data_set is None or data_set == '') and ensure_cols:
+            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
+
+        return self.__remap_chunks(chunks, data_set, ensure_cols, strip_cols, dtype_backend, errors)
 
-    def __init__(self, data_dict_file: str = None, auto_reload: bool = True, data_dict: pd.DataFrame = None):
+    @auto_reload
+    def remap_parallel(self, frames: Union[pd.DataFrame, Iterable[pd.DataFrame]], data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False,
+                       dtype_backend: str = 'numpy', errors: str = 'ignore', workers: int = None, partitions: int = None, mp_context=None) -> pd.DataFrame:
         """
-        Creates the data dictionary and validates it. It can either be initialised from a CSV file or a data frame.
+        Remaps the given data frame or data frames like `remap` does on a pool of worker processes. A single data frame is split into partitions of
+        consecutive rows. The data dictionary is pickled once and sent to each worker when it starts instead of with each partition. The remapped
+        partitions are converted to the column types of the first partition and concatenated in their original order. The categories of unordered
+        `category` columns are combined across the partitions. Like `remap_iter`, a partition is only converted if no values are lost.
 
         Args:
-            data_dict_file: The data dictionary file in CSV format to use to initialise the data dictionary.
-            auto_reload: Whether the data dictionary should automatically check for changes in the data dictionary file.
-            data_dict: The data dictionary as a data frame to use to initialise the data dictionary instead of the data dictionary file.
+            frames: The data frame to split into partitions or the data frames to remap.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to remove all columns that are not in the data set. See `remap` for details.
+            dtype_backend: The backend of the data types of the data set columns. See `remap` for details.
+            errors: How to handle values that cannot be converted. See `remap` for details.
+            workers: The number of worker processes. If not specified, the number of CPUs is used.
+            partitions: The number of partitions to split a single data frame into. If not specified, the number of workers is used.
+            mp_context: The multiprocessing context to start the workers with. See `concurrent.futures.ProcessPoolExecutor` for details.
+
+        Returns:
+            The remapped data frames concatenated into a single data frame.
         """
-        if data_dict_file is not None and data_dict is not None:
-            raise ValueError('Parameters data_dict_file and data_dict can\'t be assigned at the same time.')
+        if frames is None:
+            raise ValueError('Parameter frames not provided.')
 
-        self._data_dict_file = data_dict_file
-        self.auto_reload = auto_reload
-        self.__set_data_dict(data_dict)
+        if (data_set is None or data_set == '') and ensure_cols:
+            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
 
-        self.__load()
+        DataDict.__check_options(dtype_backend, errors)
+        workers = workers or os.cpu_count() or 1
+
+        if isinstance(frames, pd.DataFrame):
+            bounds = np.linspace(0, len(frames), min(partitions or workers, max(len(frames), 1)) + 1).astype(int)
+            frames = [frames.iloc[start:stop] for (start, stop) in zip(bounds[:-1], bounds[1:])]
+        else:
+            frames = list(frames)
+
+        if len(frames) == 0:
+            raise ValueError('Parameter frames must contain at least one data frame.')
+
+        snapshot = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        with ProcessPoolExecutor(max_workers=min(workers, len(frames)), mp_context=mp_context, initializer=_init_worker, initargs=(snapshot,)) as executor:
+            futures = [executor.submit(_remap_worker, df, data_set, ensure_cols, strip_cols, dtype_backend, errors) for df in frames]
+            results = [future.result() for future in futures]
 
-    def __load(self) -> None:
+        dtypes = results[0].dtypes.copy()
+        if all(list(df.columns) == list(dtypes.index) for df in results):
+            # All partitions are remapped at this point, so unordered categories are combined instead of dropping the values of the other partitions.
+            for (col, dtype) in dtypes.items():
+                if isinstance(dtype, pd.CategoricalDtype) and not dtype.ordered and all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in results):
+                    with contextlib.suppress(TypeError):
+                        dtypes[col] = pd.CategoricalDtype(union_categoricals([df[col] for df in results], sort_categories=True).categories)
+
+            return pd.concat([self.__align_dtypes(df, dtypes, errors) for df in results])
+
+        return self.reorder(pd.concat(results))
+
+    @auto_reload
+    def read_csv(self, filepath_or_buffer, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False, dtype_backend: str = 'numpy',
+                 errors: str = 'ignore', **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
-        Loads the data dictionary from the CSV file specified during initialisation and validates it.
+        Reads the given CSV file and remaps it like `remap` does. The types of the data set in the data dictionary are passed to the CSV parser so that
+        the values are parsed straight into the right type where possible. If `strip_cols` is true, the columns that are not in the data set are not
+        parsed at all.
+
+        Args:
+            filepath_or_buffer: The CSV file to read. See `pd.read_csv` for details.
+            data_set: The data set to use. See `remap` for details.
+            ensure_cols: Ensures all columns in the data_set are present. See `remap` for details.
+            strip_cols: Whether to only read the columns that are in the data set.
+            dtype_backend: The backend of the data types of the data set columns. See `remap` for details.
+            errors: How to handle values that cannot be converted. See `remap` for details.
+            **kwargs: Additional arguments to pass to `pd.read_csv`. A `dtype` dictionary is merged with the types derived from the data dictionary.
+
+        Returns:
+            The remapped data frame or an iterator over the remapped chunks if `chunksize` or `iterator` is specified. The chunks are remapped
+            by `remap_iter`, see there for the column types of chunks with missing values.
         """
-        if self._data_dict_file is None:
-            return
+        if (data_set is None or data_set == '') and ensure_cols:
+            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
 
-        if not path.exists(self._data_dict_file):
-            raise ValueError(f'The data dictionary file {self._data_dict_file} does not exist.')
+        csv_args = self.__csv_args(data_set, strip_cols, errors)
+        if isinstance(kwargs.get('dtype'), dict):
+            kwargs['dtype'] = {**csv_args['dtype'], **kwargs['dtype']}
 
-        if self._data_dict_updated is not None and os.path.getmtime(self._data_dict_file) == self._data_dict_updated:
-            return
+        stopwatch = _Stopwatch('read_csv')
+        reader = pd.read_csv(filepath_or_buffer, **{**csv_args, **kwargs})
 
-        data_dict = pd.read_csv(self._data_dict_file)
-        self._data_dict_updated = os.path.getmtime(self._data_dict_file)
+        if kwargs.get('chunksize') is not None or kwargs.get('iterator', False):
+            return self.remap_iter(reader, data_set, ensure_cols, strip_cols, dtype_backend, errors)
 
-        self.__set_data_dict(data_dict)
+        # The parsed data frame is not exposed, so its columns can be passed through without copying them.
+        stopwatch.lap('parse', reader)
+        return self.remap(reader, data_set, ensure_cols, strip_cols, dtype_backend, errors=errors, copy=False)
 
-    def __set_data_dict(self, data_dict: pd.DataFrame) -> None:
+    def __csv_args(self, data_set: str, strip_cols: bool, errors: str = 'ignore') -> dict:
         """
-        Sets a new data dictionary frame validates it.
+        Derives the arguments for `pd.read_csv` from the data set in the data dictionary. `str`, `bool`, `timedelta` and `datetime64` columns with
+        a `Parse Format` are read as strings so that `remap` can convert them, `int` columns are left to the parser because it falls back to floats if values are missing.
+        `float` columns are only passed to the parser if `errors` is `raise` because the parser raises on the first value that cannot be converted.
+        Otherwise, the parser still parses clean columns as floats and `remap` handles the values that cannot be converted.
+
+        `true_values` and `false_values` are not passed to the parser on purpose because they apply to all columns, so `str` columns with values like
+        `yes` would be parsed as bools, and because every value that is not in `DataDict.true_values` is `False`. `parse_dates` isn't used either because
+        the parser infers the format of each value, whereas `remap` parses the distinct values with the `Parse Format` of the column. Empty values are
+        missing values by default, so no `na_values` are needed.
 
         Args:
-            data_dict: Specifies the data dictionary.
+            data_set: The data set to use.
+            strip_cols: Whether to only read the columns that are in the data set.
+            errors: How `remap` handles values that cannot be converted.
+
+        Returns:
+            The arguments for `pd.read_csv`.
+        """
+        fields = {spec.field: spec for spec in self.__data_set_specs(data_set) if isinstance(spec.field, str) and spec.field != ''}
+
+        dtype = {}
+        for (field, spec) in fields.items():
+            typ = spec.type
+            if typ in ['str', 'bool', 'timedelta'] or (typ == 'datetime64' and spec.parse_format is not None):
+                dtype[field] = str
+            elif typ in ['object', 'category'] or (typ in ['float', 'float32', 'float64'] and errors == 'raise'):
+                dtype[field] = typ
+
+        csv_args = {'dtype': dtype}
+        if strip_cols:
+            csv_args['usecols'] = lambda col: col in fields
+
+        return csv_args
+
+    def __remap_chunks(self, chunks: Iterable[pd.DataFrame], data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str,
+                       errors: str) -> Iterator[pd.DataFrame]:
         """
-        DataDict.validate(data_dict)
+        Generates the remapped chunks for `remap_iter`.
 
-        self._data_dict = data_dict
+        Args:
+            chunks: The data frame chunks to remap.
+            data_set: The data set to use.
+            ensure_cols: Whether to ensure all columns of the data set are present.
+            strip_cols: Whether to remove all columns that are not in the data set.
+            dtype_backend: The backend of the data types of the data set columns.
+            errors: How to handle values that cannot be converted.
 
-        if data_dict is not None:
-            formats = self._data_dict[['Name', 'Format']].dropna(subset=['Format'])
-            self._formats = pd.Series(formats['Format'].values, index=formats['Name']).to_dict()
-            self._names = list(self._data_dict['Name'].values)
+        Returns:
+            An iterator over the remapped data frame chunks.
+        """
+        dtypes = None
+        for chunk in chunks:
+            stopwatch = _Stopwatch('remap')
+            df = self.__apply_plan(chunk, self.__plan(chunk, data_set, ensure_cols, strip_cols, dtype_backend), stopwatch, errors)
+            if dtypes is None:
+                dtypes = df.dtypes
+            else:
+                df = self.__align_dtypes(df, dtypes, errors)
+                stopwatch.lap('align', df)
+
+            yield df
 
     @staticmethod
-    def validate(data_dict: pd.DataFrame) -> None:
+    def __align_dtypes(df: pd.DataFrame, dtypes: pd.Series, errors: str = 'ignore') -> pd.DataFrame:
         """
-        Validates the given data dictionary and raises a `ValueError` if the validation fails.
+        Converts the columns of the given data frame to the given types if their types differ. A column is only converted if no values are lost,
+        i.e. no values become missing values like values that are not in the categories of a `category` type, and numbers keep their values like
+        floats with a fraction converted to `int`. Otherwise, the column keeps its type and it warns or raises if `errors` is `raise`.
 
         Args:
-            data_dict: The data dictionary to validate.
+            df: The data frame to convert.
+            dtypes: The column types to convert to.
+            errors: How to handle columns that cannot be converted.
 
         Returns:
+            The converted data frame.
+        """
+        if df.dtypes.equals(dtypes):
+            return df
+
+        if list(df.columns) != list(dtypes.index):
+            raise ValueError(f'The columns {list(df.columns)} do not match the expected columns {list(dtypes.index)}.')
+
+        for (col, dtype) in dtypes.items():
+            if df[col].dtype != dtype:
+                try:
+                    converted = df[col].astype(dtype)
+                    lost = converted.isna() & df[col].notna()
+                    if is_numeric_dtype(converted) and is_numeric_dtype(df[col]) and not is_bool_dtype(converted):
+                        lost |= (converted != df[col]).fillna(False) & df[col].notna()
+                    if lost.any():
+                        raise ValueError(f'{lost.sum()} values would be lost, e.g. {df[col][lost].unique()[:5].tolist()}.')
+                    df[col] = converted
+                except (TypeError, ValueError) as e:
+                    if errors == 'raise':
+                        raise ValueError(f'Column {col} could not be converted to {dtype}. Use nullable types to keep the types of all chunks the same.') from e
+                    warnings.warn(f'Column {col} could not be converted to {dtype}.\nError message: {e}')
 
-        Raises:
-            ValueError: If the given data dictionary is not valid.
+        return df
+
+    def __apply_plan(self, df: pd.DataFrame, plan: _RemapPlan, stopwatch: _Stopwatch, errors: str = 'ignore', copy: bool = True) -> pd.DataFrame:
         """
-        if data_dict is None:
-            return
+        Applies the given remap plan to the given data frame.
 
-        data_dict = data_dict.copy()
+        Args:
+            df: The data frame to remap.
+            plan: The remap plan for the data frame.
+            stopwatch: The stopwatch that measures the stages of the remap.
+            errors: How to handle values that cannot be converted.
+            copy: Whether the remapped data frame must not share memory with the given data frame. See `remap` for details.
 
-        # Check that all expected columns exist.
-        if not set(data_dict.columns) >= set(DataDict.column_names):
-            raise ValueError(f'The data dictionary must at least include the following column names: {DataDict.column_names}')
+        Returns:
+            The remapped data frame.
+        """
+        self._counters['remaps'] += 1
+        stopwatch.lap('plan', df)
+
+        # Works on a shallow copy so that the columns of the given data frame are not replaced. Without copy, the columns are collected in a
+        # dictionary instead and the remapped data frame is assembled from them once at the end.
+        out = df.copy(deep=False) if copy else dict(df.items())
+
+        # Map values of str columns so that only non-empty strings remain.
+        # Str columns with a nullable type are converted to `string` afterwards.
+        nullable_cols = set(plan.nullable_cols)
+        for col in plan.str_cols:
+            out[col] = self.__normalise_str(out[col])
+            if col in nullable_cols:
+                out[col] = out[col].astype('string')
+        stopwatch.lap('str', out)
 
-        # Check that all types are supported Python types.
-        if not set(data_dict['Type'].values) <= set(DataDict.supported_types):
-            raise ValueError(
-                f'The Type column of the data dictionary contains the following unsupported types {set(data_dict["Type"].values) - set(DataDict.supported_types)}. Only the following types are supported: {DataDict.supported_types}')
+        # Ensure that nan is represented as None so that column type conversion does not result in object types if nan is present.
+        for col in plan.blank_cols:
+            out[col] = self.__blank_to_nan(out[col])
+        stopwatch.lap('blank', out)
 
-        # Check that names are unique.
-        if any(data_dict['Name'].duplicated()):
-            raise ValueError(f'The Name column contains the following duplicates: {data_dict["Name"][data_dict["Name"].duplicated()].values}. The names must be unique.')
+        # Map values of bool columns.
+        for col in plan.bool_cols:
+            out[col] = self.__parse_bool(out[col])
+        stopwatch.lap('bool', out)
 
-        # Check that dataset and field combination is unique.
-        data_dict = data_dict.replace('', np.nan)
-        data_dict['Field ID'] = data_dict['Data Set'] + '.' + data_dict['Field']
-        if any(data_dict['Field ID'][data_dict['Field ID'].isnull() == False].duplicated()):
-            raise ValueError(f'The combination of columns Data Set and Field contains the following duplicates: {data_dict["Field ID"][data_dict["Field ID"].duplicated()].values}. The combination must be unique.')
+        # Treat bool and str separately 'cause all non-empty strings are converted to True.
+        # Map values of non-bool, non-str columns using data type one by one so that values that cannot be converted only affect their own column.
+        failures = {}
+        for (col, typ) in plan.types_map.items():
+            out[col], failure = self.__convert(out[col], typ, errors, col in nullable_cols, plan.parsers.get(col), plan.categories.get(col))
+            if failure is not None:
+                failures[plan.columns_map.get(col, col)] = (typ,) + failure
+        stopwatch.lap('astype', out)
+
+        if plan.arrow_cols:
+            for (col, typ) in plan.arrow_cols.items():
+                out[col] = self.__to_arrow(out[col], typ)
+            stopwatch.lap('arrow', out)
+
+        if copy:
+            df = out.rename(columns=plan.columns_map)
+            stopwatch.lap('rename', df)
+
+            # Reorders, ensures and strips the columns in one go.
+            df = df.reindex(columns=plan.columns) if plan.missing_cols else df[plan.columns]
+            stopwatch.lap('columns', df)
+        else:
+            df = self.__assemble(df, out, plan)
+            stopwatch.lap('assemble', df)
+
+        if failures:
+            DataDict.__set_attr(df, 'conversion_report', pd.DataFrame.from_dict(failures, orient='index', columns=['Type', 'Failures', 'Samples']))
+
+        return df
 
     @staticmethod
-    def __str_to_bool(value: str) -> object:
+    def __assemble(df: pd.DataFrame, cols: Dict[str, pd.Series], plan: _RemapPlan) -> pd.DataFrame:
         """
-        Converts the given string to a bool if the argument is a string otherwise it returns the value untouched. `yes`, `true`, `1` are considered `True`, the rest is considered `False`.
+        Assembles the remapped data frame from the given columns in a single pass. The columns are renamed, reordered, ensured and stripped without
+        copying them, so the columns that have not been converted still share their memory with the given data frame.
 
         Args:
-            value: The value to convert to a bool.
+            df: The data frame that is remapped.
+            cols: The converted and the untouched columns of the data frame by their original column name.
+            plan: The remap plan for the data frame.
 
         Returns:
-            The converted bool if the value is a string. Otherwise the value passed in the argument.
+            The remapped data frame.
         """
-        if pd.isnull(value):
-            return None
-
-        if not isinstance(value, str):
-            return value
+        names = {plan.columns_map.get(col, col): col for col in cols}
+        missing_cols = set(plan.missing_cols)
 
-        return value.lower() in ['yes', 'true', '1']
+        # The columns are passed in order instead of with `columns` because pandas would box all the columns into an object array to select them.
+        return pd.DataFrame({col: pd.Series(np.nan, index=df.index, dtype='float64') if col in missing_cols else cols[names[col]] for col in plan.columns},
+                            index=df.index, copy=False)
 
-    def df(self, data_set: str = None, any_data_set: bool = False) -> pd.DataFrame:
+    @staticmethod
+    def __convert(col: pd.Series, typ: str, errors: str, nullable: bool = False, parser: Tuple[str, str, str] = None,
+                  categories: pd.CategoricalDtype = None) -> Tuple[pd.Series, Tuple[int, list]]:
         """
-        Gets the data set with the given name as a data frame.
+        Converts the given column to the given type. If the column cannot be converted with `astype`, the values are converted with the vectorised
+        coercer of the type such as `pd.to_numeric` to find the values that cannot be converted. Columns with parse options are always converted
+        with `__parse_times` and columns with declared categories are converted by looking up the codes of their values in the categories.
 
         Args:
-            data_set: The data set to filter by. If this value matches a value in the `Data Set` column of the data dictionary, the matching rows are returned.
-            If `data_set` is not specified, the entries with empty `Data Set` are returned.
-            any_data_set: Whether to return all data sets in the data frame.
+            col: The column to convert.
+            typ: The type in the `Type` column of the data dictionary.
+            errors: How to handle values that cannot be converted. See `remap` for details.
+            nullable: Whether to convert the column to the nullable pandas type of the type.
+            parser: The `Parse Format`, `Time Zone` and `Unit` of `datetime64` and `timedelta` columns.
+            categories: The categorical type of `category` columns with declared `Categories`.
 
         Returns:
-            The data set as a data frame, index by the `Field` column.
+            The converted column and, if any values cannot be converted, the number of these values and samples of them.
+
+        Raises:
+            ValueError: If values cannot be converted and `errors` is `raise`.
         """
-        if any_data_set and data_set is not None:
-            raise ValueError('Either data_set can be provided or any_data_set can be True but not both.')
+        pandas_type = DataDict.__pandas_type(typ, nullable)
+        exact = parser is not None or categories is not None
+        is_int = typ in ['int', 'int32', 'int64']
 
-        if data_set is None:
-            data_set = ''
+        # `astype` truncates numbers with a fraction when floats are cast to integers, so these are converted by the coercer to find them.
+        fractions = False
+        if is_int and is_float_dtype(col.dtype):
+            values = col.to_numpy(dtype=float, na_value=np.nan)
+            fractions = bool(((values % 1 != 0) & ~np.isnan(values)).any())
 
-        return self._data_dict[(self._data_dict['Data Set'] == data_set) | any_data_set].set_index('Field')
+        if not exact and not fractions:
+            try:
+                return col.astype(pandas_type), None
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        # Parsers and categories only convert the distinct values and therefore also know which values failed.
+        failed = None
+        if parser is not None:
+            coerced, failed = DataDict.__parse_times(col, typ, *parser)
+        elif categories is not None:
+            coerced, failed = DataDict.__categorize(col, categories)
+        elif typ in ['int', 'int32', 'int64', 'float', 'float32', 'float64']:
+            coerced = pd.to_numeric(col, errors='coerce')
+        elif typ == 'datetime64':
+            coerced = pd.to_datetime(col, errors='coerce')
+        elif typ == 'timedelta':
+            coerced = pd.to_timedelta(col, errors='coerce')
+        else:
+            return col, None
+
+        # Integer columns cannot hold missing values unless they are nullable, so missing values cannot be converted either.
+        # Numbers with a fraction cannot be converted to integers without losing the fraction.
+        if failed is None:
+            failed = coerced.isna().values if is_int and not nullable else coerced.isna().values & col.notna().values
+        if is_int:
+            failed |= (coerced.values % 1 != 0) & coerced.notna().values
+        if not failed.any():
+            return coerced if exact else coerced.astype(pandas_type), None
+
+        failure = (int(failed.sum()), list(pd.unique(col.values[failed])[:DataDict.failure_samples]))
+        if errors == 'raise':
+            raise ValueError(f'{failure[0]} values of column {col.name} could not be converted to {typ}, e.g. {failure[1]}.')
+
+        if errors == 'ignore':
+            return col, failure
+
+        if is_int:
+            coerced = coerced.mask(failed)
+            return coerced.astype(pandas_type) if nullable else coerced, failure
+
+        return coerced if exact else coerced.astype(pandas_type), failure
 
-    @auto_reload
-    def remap(self, df: pd.DataFrame, data_set: str = None, ensure_cols: bool = False, strip_cols: bool = False) -> pd.DataFrame:
+    @staticmethod
+    def __categorize(col: pd.Series, categories: pd.CategoricalDtype) -> Tuple[pd.Series, np.ndarray]:
         """
-        Renames the columns in the given data frame based on based on the `Data Set` and `Field` attributes in the data dictionary to `Name`
-        if such a mapping found and converts the columns data to `Type`. It also reorders the columns based on the order of the data dictionary entries.
+        Converts the given column to the given categorical type. The codes of the distinct values are looked up in the declared categories once
+        and then taken for all values so that the categories don't need to be discovered. Values that are not in the categories are missing.
+        If the categories are numbers, the distinct values are converted to numbers first so that strings like `1` read from a CSV file match them.
 
         Args:
-            df: The data frame to remap.
-            data_set: The data set to use. If this value matches a value in the `Data Set` column of the data dictionary, then the corresponding names in the `Field`
-                column are used to rename the columns of the given data frame to the `Name` column name. If `dataset` is not specified, the values in `Field` column
-                that have entries with empty `Data Set` are used.
-            ensure_cols: Ensures all columns in the data_set are present. If the source data frame does not contain them, empty ones are created. This parameter can
-                only be true if data_set is specified. This is useful when the data frame to be remapped may not have all the columns if it is empty.
-            strip_cols: Whether to remove all columns that are not in the data set. In any case, it will leave the index untouched.
+            col: The column to convert.
+            categories: The categorical type.
 
         Returns:
-            The remapped data frame.
+            The categorical column and the mask of the values that are not in the categories.
         """
-        if df is None:
-            raise ValueError('Parameter df not provided.')
+        codes, uniques = pd.factorize(col)
+        if is_numeric_dtype(categories.categories.dtype) and not is_numeric_dtype(uniques.dtype):
+            uniques = pd.to_numeric(np.asarray(uniques, dtype=object), errors='coerce')
+        lookup = np.append(categories.categories.get_indexer(uniques), -1)
 
-        if (data_set is None or data_set == '') and ensure_cols:
-            raise ValueError('Parameter data_set cannot be None or empty if ensure_cols is True.')
+        # The code of missing values is -1 and therefore points to the -1 appended at the end.
+        category_codes = lookup[codes]
+        failed = (category_codes == -1) & (codes != -1)
+        return pd.Series(pd.Categorical.from_codes(category_codes, dtype=categories), index=col.index, name=col.name), failed
 
-        dd = self.df(data_set)
-
-        types_map = dd['Type'].to_dict()
-        types_map = {col: typ for (col, typ) in types_map.items() if col in df.columns}  # Remove mapping for columns that are not present in data frame.
+    @staticmethod
+    def __parse_times(col: pd.Series, typ: str, parse_format: str = None, time_zone: str = None, unit: str = None) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Parses the given column into timestamps or time deltas in a single vectorised pass. Repeated values such as the same timestamp in many rows
+        are only parsed once because the distinct values are parsed and then looked up by their codes. Values that cannot be parsed are missing.
 
-        # Map values of str columns.
-        str_cols = [col for (col, typ) in types_map.items() if typ == 'str']
-        df[str_cols] = df[str_cols].apply(lambda col: col.map(lambda val: val if isinstance(val, str) and val != '' else None))
+        Args:
+            col: The column to parse.
+            typ: The type in the `Type` column of the data dictionary, i.e. `datetime64` or `timedelta`.
+            parse_format: The `strftime` format of the timestamps.
+            time_zone: The time zone to localise naive timestamps to or to convert timestamps with a time zone to.
+            unit: The unit of numeric values.
 
-        # Ensure that nan is represented as None so that column type conversion does not result in object types if nan is present.
-        df = df.replace('', np.nan)
+        Returns:
+            The parsed column and the mask of the values that cannot be parsed.
+        """
+        codes, uniques = pd.factorize(col)
+        values = pd.Index(uniques)
+        if unit is not None and not is_numeric_dtype(values.dtype):
+            values = pd.to_numeric(values, errors='coerce')
+
+        if typ == 'timedelta':
+            parsed = pd.to_timedelta(values, unit=unit, errors='coerce')
+        else:
+            parsed = pd.to_datetime(values, format=parse_format, unit=unit, errors='coerce', cache=False)
+            if time_zone is not None:
+                # Local times that are ambiguous or don't exist because of daylight saving time fail like values that cannot be parsed.
+                parsed = parsed.tz_localize(time_zone, ambiguous='NaT', nonexistent='NaT') if parsed.tz is None else parsed.tz_convert(time_zone)
+
+        # The code of missing values is -1 and is filled with NaT.
+        failed = np.append(parsed.isna(), False)[codes]
+        return pd.Series(parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=col.index, name=col.name), failed
+
+    def __plan(self, df: pd.DataFrame, data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str = 'numpy') -> _RemapPlan:
+        """
+        Gets the remap plan for the given data frame and data set from the plan cache or compiles it if it is not cached yet.
+        The cache is keyed by the data set, the remap options and the schema of the data frame and is cleared whenever a new data dictionary is set.
 
-        # Map values of bool columns.
-        bool_cols = [col for (col, typ) in types_map.items() if typ == 'bool']
-        df[bool_cols] = df[bool_cols].apply(lambda col: col.map(lambda val: self.__str_to_bool(val)))
+        Args:
+            df: The data frame to remap.
+            data_set: The data set to use.
+            ensure_cols: Whether to ensure all columns of the data set are present.
+            strip_cols: Whether to remove all columns that are not in the data set.
+            dtype_backend: The backend of the data types of the data set columns.
 
-        # Treat bool and str separately 'cause all non-empty strings are converted to True.
-        # Map values of non-bool, non-str columns using data type.
-        no_bool_str_types_map = {col: typ for (col, typ) in types_map.items() if typ not in ['bool', 'str']}
-        df = df.astype(no_bool_str_types_map, errors='ignore')
+        Returns:
+            The remap plan.
+        """
+        key = (data_set, ensure_cols, strip_cols, dtype_backend, self.nullable, tuple(df.columns), tuple(df.dtypes), tuple(df.index.names))
+        state = self._state
+        # The plan cache is shared by all threads, so the lookup and the update of the LRU order are done under the lock. Plans are compiled
+        # outside of it so that threads using cached plans don't wait for the compilation.
+        with self._plans_lock:
+            plan = state.plans.get(key)
+            if plan is not None:
+                self._counters['plan_hits'] += 1
+                state.plans.move_to_end(key)
+                return plan
+
+            self._counters['plan_misses'] += 1
+
+        plan = self.__compile_plan(df, data_set, ensure_cols, strip_cols, dtype_backend)
+
+        # The plan is cached in the plan cache of the state it was looked up in, so a plan compiled while a new data dictionary is swapped in
+        # is discarded together with the previous state instead of being cached for the new data dictionary.
+        with self._plans_lock:
+            state.plans[key] = plan
+            if len(state.plans) > self.plan_cache_size:
+                state.plans.popitem(last=False)
+
+        return plan
+
+    def __compile_plan(self, df: pd.DataFrame, data_set: str, ensure_cols: bool, strip_cols: bool, dtype_backend: str) -> _RemapPlan:
+        """
+        Compiles the remap plan for the given data frame and data set by querying the data dictionary.
 
-        columns_map = dd['Name'].to_dict()
-        df = df.rename(columns=columns_map)
-        df = self.reorder(df)
+        Args:
+            df: The data frame to remap.
+            data_set: The data set to use.
+            ensure_cols: Whether to ensure all columns of the data set are present.
+            strip_cols: Whether to remove all columns that are not in the data set.
+            dtype_backend: The backend of the data types of the data set columns.
 
+        Returns:
+            The remap plan.
+        """
+        specs = self.__data_set_specs(data_set)
+        df_cols = set(df.columns)
+
+        # Remove mapping for columns that are not present in data frame.
+        fields = {spec.field: spec for spec in specs}
+        fields = {col: spec for (col, spec) in fields.items() if col in df_cols}
+        types_map = {col: spec.type for (col, spec) in fields.items()}
+        # Arrow integers can hold missing values, so int columns are converted to the nullable integer types before they are converted to Arrow.
+        nullable_cols = [col for (col, spec) in fields.items()
+                         if self.__is_nullable(spec) or (dtype_backend == 'pyarrow' and spec.type in ['int', 'int32', 'int64'])]
+        parsers = {col: (spec.parse_format, spec.time_zone, spec.unit) for (col, spec) in fields.items()
+                   if spec.type in ['datetime64', 'timedelta'] and (spec.parse_format, spec.time_zone, spec.unit) != (None, None, None)}
+        categories = {col: spec.categories for (col, spec) in fields.items() if spec.type == 'category' and spec.categories is not None}
+        columns_map = {col: spec.name for (col, spec) in fields.items()}
+
+        columns = self.__reorder_cols([columns_map.get(col, col) for col in df.columns.values])
+        ds_cols = [spec.name for spec in specs]
+        ds_names = set(ds_cols)
+
+        missing_cols = []
         if ensure_cols:
-            df = self.ensure_cols(df, data_set=data_set)
+            current_cols = set(columns) | set(df.index.names)
+            missing_cols = [v for v in ds_cols if v not in current_cols]
+            columns = columns + missing_cols
 
         if strip_cols:
-            df = self.strip_cols(df, data_set=data_set)
-
-        return df
+            columns = [v for v in columns if v in ds_names]
+
+        # Columns that are already Arrow-backed are converted by Arrow only so that their buffers can be kept.
+        arrow_cols = {col: typ for (col, typ) in types_map.items() if typ != 'object'} if dtype_backend == 'pyarrow' else {}
+        # Columns with parse options are parsed by pandas because Arrow only parses ISO timestamps and columns with declared categories are
+        # converted by pandas so that the dictionary of their Arrow arrays are the declared categories.
+        numpy_types_map = {col: typ for (col, typ) in types_map.items()
+                           if col in parsers or col in categories or not (col in arrow_cols and self.__is_arrow(df.dtypes[col]))}
+
+        str_cols = [col for (col, typ) in numpy_types_map.items() if typ == 'str']
+        blank_cols = [col for (col, dtype) in df.dtypes.items() if col not in str_cols and self.__may_contain_str(dtype) and not self.__is_arrow(dtype)]
+
+        return _RemapPlan(str_cols=str_cols,
+                          blank_cols=blank_cols,
+                          bool_cols=[col for (col, typ) in numpy_types_map.items() if typ == 'bool'],
+                          types_map={col: typ for (col, typ) in numpy_types_map.items()
+                                     if typ not in ['bool', 'str'] and (col in blank_cols or
+                                                                        not (self.__has_categories(df.dtypes[col], categories[col]) if col in categories else
+                                                                             self.__is_type(df.dtypes[col], typ, col in nullable_cols, fields[col].time_zone)))},
+                          columns_map=columns_map,
+                          columns=columns,
+                          missing_cols=missing_cols,
+                          arrow_cols=arrow_cols,
+                          nullable_cols=nullable_cols,
+                          parsers=parsers,
+                          categories=categories)
 
     @auto_reload
     def reorder(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -264,8 +2235,21 @@ class DataDict:
         Returns:
             The reordered data frame.
         """
-        return df[[x for x in self._names if x in list(df.columns.values)]
-                  + [x for x in list(df.columns.values) if x not in self._names]]
+        return df[self.__reorder_cols(list(df.columns.values))]
+
+    def __reorder_cols(self, cols: list) -> list:
+        """
+        Orders the given column names based on the order of the matching entries in the data dictionary. Column names that are not in the
+        data dictionary are added at the end in their original order.
+
+        Args:
+            cols: The column names to order.
+
+        Returns:
+            The ordered column names.
+        """
+        positions = self._positions
+        return sorted({x for x in cols if x in positions}, key=positions.__getitem__) + [x for x in cols if x not in positions]
 
     @auto_reload
     def ensure_cols(self, df: pd.DataFrame, cols: list = None, data_set: str = None) -> pd.DataFrame:
@@ -286,9 +2270,9 @@ class DataDict:
             raise ValueError('Either the cols or the data_set arguments can be provided but not both.')
 
         if cols is None:
-            cols = list(self.df(data_set)['Name'].values)
+            cols = [spec.name for spec in self.__data_set_specs(data_set)]
 
-        current_cols = list(df.columns.values)+list(df.index.names)
+        current_cols = set(df.columns.values) | set(df.index.names)
         missing_cols = [v for v in cols if v not in current_cols]
         return df.reindex(columns=(list(df.columns.values)+missing_cols))
 
@@ -309,40 +2293,115 @@ class DataDict:
         if any_data_set and data_set is not None:
             raise ValueError('Either data_set can be provide or any_data_set can be True but not both.')
 
-        ds_cols = list(self.df(data_set, any_data_set)['Name'].values)
+        ds_cols = {spec.name for spec in self.__data_set_specs(data_set, any_data_set)}
         df_cols = [v for v in df.columns if v in ds_cols]
         return df[df_cols]
 
+    @auto_reload
+    def aggregate(self, df: pd.DataFrame, by=None) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Aggregates the columns of the given data frame with their `Default Aggregation` in the data dictionary in a single `agg` call.
+        Columns without a default aggregation are ignored.
+
+        Args:
+            df: The data frame to aggregate.
+            by: The columns or index levels to group by. See `pd.DataFrame.groupby` for details. If not specified, the whole data frame is aggregated.
+
+        Returns:
+            The aggregated values as a series if `by` is not specified. Otherwise, a data frame with a row for each group.
+        """
+        if df is None:
+            raise ValueError('Parameter df is mandatory')
+
+        by_cols = {col for col in (by if isinstance(by, list) else [by]) if isinstance(col, str)}
+        funcs = {col: self._aggregations[col].agg_func() for col in df.columns if col in self._aggregations and col not in by_cols}
+        if len(funcs) == 0:
+            raise ValueError('None of the columns of the data frame have a default aggregation.')
+
+        if by is None:
+            return df.agg(funcs)
+
+        return df.groupby(by).agg(funcs)
+
     @staticmethod
-    def add_stats(df: pd.DataFrame) -> pd.DataFrame:
+    def add_stats(df: pd.DataFrame, inline: bool = True, subtotals=None) -> pd.DataFrame:
         """
-        Adds the `Total` and `Average` of the column values as two rows at the top of the data frame.
+        Adds the `Total` and `Average` of the column values as two rows at the top of the data frame. The stats of each numeric column are calculated
+        in a single NumPy pass over the column values.
 
         Args:
             df: The data frame to summarise.
+            inline: Whether to add the stats as rows at the top of the data frame. If false, the data frame is not copied and the stats are
+                attached as a separate data frame in the `stats_df` attribute instead.
+            subtotals: The index level or levels to calculate the stats for each group for. If specified, the stats of the groups are calculated
+                with a single `groupby` and attached as a separate data frame in the `subtotals` attribute.
 
         Returns:
-            The data frame with the `Total` and `Average` at the top.
+            The data frame with the `Total` and `Average` at the top or attached.
         """
         if df is None:
             raise ValueError('Parameter df is mandatory')
 
-        num_agg_map = {col: DataDict.stats.keys() for col in df if is_numeric_dtype(df[col]) and df[col].dtype != np.bool}
-        aggr_row = df.agg(num_agg_map).rename(DataDict.stats)
-        if len(df.index.names) > 1:
-            aggr_row = pd.concat([aggr_row], keys=[np.nan] * len(DataDict.stats.keys()), names=df.index.names[1:])
-        df = pd.concat([df.iloc[:0], aggr_row, df], sort=False)
+        stopwatch = _Stopwatch('add_stats')
+        num_cols = [col for col in df if is_numeric_dtype(df[col]) and not is_bool_dtype(df[col])]
+        aggr_rows = pd.DataFrame({col: DataDict.__stats(df[col]) for col in num_cols}, index=list(DataDict.stats.values()), columns=num_cols)
+        stopwatch.lap('stats', aggr_rows)
+
+        if subtotals is not None:
+            aggr_groups = df[num_cols].groupby(level=subtotals).agg(list(DataDict.stats.keys())).rename(columns=DataDict.stats, level=1)
+            stopwatch.lap('subtotals', aggr_groups)
 
-        # Adds the dictionary of stats to the data frame.
-        if not hasattr(df, 'stats'):
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                df.stats = {}
+        if not inline:
+            df = df.copy(deep=False)
+            DataDict.__set_attr(df, 'stats_df', aggr_rows)
+        else:
+            if len(df.index.names) > 1:
+                aggr_rows.index = pd.MultiIndex.from_tuples([(np.nan,) * (len(df.index.names) - 1) + (stat,) for stat in aggr_rows.index], names=df.index.names)
+            df = pd.concat([df.iloc[:0], aggr_rows, df], sort=False)
+            stopwatch.lap('concat', df)
 
-        df.stats = {**df.stats, **DataDict.stats}
+            # Adds the dictionary of stats to the data frame.
+            DataDict.__set_attr(df, 'stats', {**getattr(df, 'stats', {}), **DataDict.stats})
+
+        if subtotals is not None:
+            DataDict.__set_attr(df, 'subtotals', aggr_groups)
 
         return df
 
+    @staticmethod
+    def __stats(col: pd.Series) -> list:
+        """
+        Calculates the stats in `DataDict.stats` for the given numeric column. The sum and the mean are calculated with NumPy in one pass, other stats are
+        calculated by pandas.
+
+        Args:
+            col: The column to calculate the stats for.
+
+        Returns:
+            The stats in the order of `DataDict.stats`.
+        """
+        values = col.to_numpy(dtype=float, na_value=np.nan)
+        valid = ~np.isnan(values)
+        total = values.sum(where=valid)
+        count = valid.sum()
+
+        numpy_stats = {'sum': total, 'mean': total / count if count > 0 else np.nan}
+        return [numpy_stats[stat] if stat in numpy_stats else col.agg(stat) for stat in DataDict.stats.keys()]
+
+    @staticmethod
+    def __set_attr(df: pd.DataFrame, name: str, value) -> None:
+        """
+        Sets an attribute on the given data frame without the warning that pandas issues because attributes are not columns.
+
+        Args:
+            df: The data frame to set the attribute on.
+            name: The name of the attribute.
+            value: The value of the attribute.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            setattr(df, name, value)
+
     @staticmethod
     def has_stats(df: pd.DataFrame):
         """
@@ -369,50 +2428,120 @@ class DataDict:
         if df is None:
             raise ValueError('Parameter df is mandatory')
 
-        # Necessary to define separate function instead of using lambda directly (see https://stackoverflow.com/questions/36805071/dictionary-comprehension-with-lambda-functions-gives-wrong-results)
-        def make_func(f: str = None):
-            def format_value(x):
-                if f is None or f == '':
-                    return x if not pd.isnull(x) else '-'
+        # If mean is part of the stats, then the integer numbers need to be formatted as floats because the mean of integers can be float.
+        # Nullable integer columns keep their integer format and only the numbers with a fraction are formatted as floats.
+        replace_int = self.has_stats(df) and 'mean' in df.stats.keys()
+
+        self._counters['formats'] += 1
+        stopwatch = _Stopwatch('format')
+        df = df.copy(deep=False)
+        for col in df.columns.values:
+            f = self._formats.get(col)
+            spec = self._specs.get(col)
+            integral = spec is not None and spec.type in ['int', 'int32', 'int64'] and self.__is_nullable(spec)
+            try:
+                df[col] = self.__format_col(df[col], f.replace(':d', ':.1f') if replace_int and f is not None and not integral else f, integral)
+            except ValueError as e:
+                warnings.warn(f'A value in column {col} could not be formatted.\nError message: {e}')
+        stopwatch.lap('format', df)
+
+        return df
 
-                return f.format(x) if not pd.isnull(x) else '-'
+    @staticmethod
+    def __format_col(col: pd.Series, f: str = None, integral: bool = False) -> pd.Series:
+        """
+        Formats the given column with the given format string. If no format string is given, only the missing values are replaced.
 
-            # If mean is part of the stats, then the integer numbers need to be formatted as floats because the mean of integers can be float.
-            if self.has_stats(df) and 'mean' in df.stats.keys() and f is not None:
-                f = f.replace(':d', ':.1f')
+        Args:
+            col: The column to format.
+            f: The format string.
+            integral: Whether numbers without a fraction are rendered as integers. See `_Formatter` for details.
 
-            return lambda x: format_value(x)
+        Returns:
+            The formatted column.
+        """
+        if f is None or f == '':
+            missing = col.isnull()
+            return col.astype(object).where(~missing, _Formatter.missing) if missing.any() else col.copy()
 
-        # Assembles a dictionary with columns as key and format functions as values but only for the columns that are actually in the data frame.
-        formats = {col: make_func(f) for (col, f) in self._formats.items() if col in df.columns.values}
-        formats = {**formats, **{col: make_func() for col in set(df.columns.values) - set(self._formats.keys())}}
+        return _formatter(f, integral)(col)
 
-        df = df.copy()
-        for col, value in formats.items():
-            try:
-                df[col] = df[col].apply(value)
-            except ValueError as e:
-                warnings.warn(f'A value in column {col} could not be formatted.\nError message: {e}')
+    def __getstate__(self) -> dict:
+        """
+        Gets the state to pickle the data dictionary with. Only the data dictionary frame and its fingerprint are pickled. A data dictionary that is
+        unpickled is not linked to the data dictionary file anymore and is therefore not reloaded.
 
-        return df
+        Returns:
+            The state of the data dictionary.
+        """
+        return {'data_dict': self._data_dict, 'version': self.version, 'plan_cache_size': self.plan_cache_size, 'nullable': self.nullable}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the data dictionary from the pickled state without validating it again.
+
+        Args:
+            state: The state returned by `__getstate__`.
+        """
+        self._data_dict_file = None
+        self._load_lock = threading.Lock()
+        self._plans_lock = threading.Lock()
+        self._counters = {'loads': 0, 'load_seconds': 0.0, 'plan_hits': 0, 'plan_misses': 0, 'remaps': 0, 'formats': 0}
+        self.snapshot = False
+        self.auto_reload = False
+        self.reload_strategy = 'manual'
+        self.reload_interval = 1.0
+        self.plan_cache_size = state['plan_cache_size']
+        self.nullable = state['nullable']
+        self.__set_data_dict(state['data_dict'], version=state['version'])
 
     def __hash__(self):
         """
-        Calculates the hash value of the data dictionary by calculating the hash value of the data dictionary data frame.
+        Gets the hash value of the data dictionary based on the fingerprint of its content in `version`, which is only calculated when the data
+        dictionary is loaded.
 
         Returns:
             The hash value of the data dictionary.
         """
-        return hash(pickle.dumps(self.data_dict))
+        return hash(self.version)
+
+
+class _LazyMeta:
+    """
+    Descriptor that builds the data dictionary of the data dictionary columns on first access so that importing the module does not build and validate it.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.value = None
+        self.lock = threading.Lock()
+
+    def __get__(self, obj, objtype=None) -> 'DataDict':
+        if self.value is None:
+            with self.lock:
+                if self.value is None:
+                    self.value = self.build()
 
+        return self.value
 
-DataDict.meta = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
-                                                          data={0: ['data_dict', 'data_set', 'Data Set', 'Used when mapping in combination with Field to rename to the column to Name.', 'str', '{:s}'],
-                                                                1: ['data_dict', 'field', 'Field', 'Column name of the data frame to map to Name.', 'str', '{:s}'],
-                                                                2: ['data_dict', 'name', 'Name', 'Column name that is unique throughout the data dictionary.', 'str', '{:s}'],
-                                                                3: ['data_dict', 'description', 'Description', 'Description of the column name. This can be used to provide additional information when displaying the data frame.', 'str',
-                                                                    '{:s}'],
-                                                                4: ['data_dict', 'type', 'Type', 'Type the column should be cast to.', 'str', '{:s}'],
-                                                                5: ['data_dict', 'format', 'Format',
-                                                                    'Format to use when values need to be converted to a string representation. The format string has to be a Python format string such as {:.0f}%', 'str', '{:s}']},
-                                                          columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+def _meta() -> DataDict:
+    """
+    Builds the data dictionary that describes the columns of a data dictionary.
+
+    Returns:
+        The data dictionary.
+    """
+    return DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                     data={0: ['data_dict', 'data_set', 'Data Set', 'Used when mapping in combination with Field to rename to the column to Name.', 'str', '{:s}'],
+                                                           1: ['data_dict', 'field', 'Field', 'Column name of the data frame to map to Name.', 'str', '{:s}'],
+                                                           2: ['data_dict', 'name', 'Name', 'Column name that is unique throughout the data dictionary.', 'str', '{:s}'],
+                                                           3: ['data_dict', 'description', 'Description', 'Description of the column name. This can be used to provide additional information when displaying the data frame.', 'str',
+                                                               '{:s}'],
+                                                           4: ['data_dict', 'type', 'Type', 'Type the column should be cast to.', 'str', '{:s}'],
+                                                           5: ['data_dict', 'format', 'Format',
+                                                               'Format to use when values need to be converted to a string representation. The format string has to be a Python format string such as {:.0f}%', 'str', '{:s}']},
+                                                     columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+
+DataDict.meta = _LazyMeta(_meta)
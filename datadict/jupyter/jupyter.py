@@ -1,11 +1,14 @@
 import pandas as pd
-import ipywidgets as widgets
 import os
-from IPython.display import display as displ
 from datadict import DataDict
 
+# ipywidgets and IPython are only imported when a data frame is displayed so that importing this module stays fast.
+
 
 def _display_df(self, df_output: pd.DataFrame, index: bool = True):
+    import ipywidgets as widgets
+    from IPython.display import display as displ
+
     df_style = self.format(df_output).style
     if not index: df_style = df_style.hide_index()
 
@@ -17,8 +20,11 @@ def _display_df(self, df_output: pd.DataFrame, index: bool = True):
 
 
 def _display_dd(self, df_output: pd.DataFrame):
-    data_dict = self._data_dict[['Name', 'Description']]
-    data_dict = data_dict[data_dict['Name'].isin(df_output.columns)]
+    import ipywidgets as widgets
+    from IPython.display import display as displ
+
+    rows = sorted({self._positions[col] for col in df_output.columns if col in self._positions})
+    data_dict = self._data_dict[['Name', 'Description']].iloc[rows]
 
     dd_style = data_dict.style.format(self._formats).hide_index().set_table_styles([
             dict(selector="th", props=[("text-align", "left")]),
@@ -36,6 +42,8 @@ def _display_dd(self, df_output: pd.DataFrame):
 
 
 def _display_footer(self, df: pd.DataFrame, df_output: pd.DataFrame, title: str = None, excel_file: str = None):
+    import ipywidgets as widgets
+
     rows = f'{str(df_output.shape[0]) + " out of " if df.shape[0] != df_output.shape[0] else ""}{df.shape[0]:d}'
     columns = f'{df.shape[1]:d}'
     title_size = widgets.HTML(
@@ -69,6 +77,8 @@ def display(self, df: pd.DataFrame, head: int = 10, stats: bool = False, title:
     Returns:
         Composite Jupyter widget with data frame.
     """
+    import ipywidgets as widgets
+
     df_output = df
 
     if head is not None:
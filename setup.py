@@ -25,5 +25,6 @@ setup(name='pandas-datadict',
         ],
         packages=['datadict', 'datadict.jupyter'],
         include_package_data=True,
-        install_requires=['pandas>=0.19', 'openpyxl']
+        install_requires=['pandas>=1.1.3', 'openpyxl'],
+        extras_require={'arrow': ['pandas>=1.5', 'pyarrow>=7'], 'dask': ['dask[dataframe]']}
 )
\ No newline at end of file
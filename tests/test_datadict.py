@@ -3,10 +3,24 @@ import os
 from datadict import DataDict
 import logging as log
 import pandas as pd
-from pandas.util.testing import assert_frame_equal
+from pandas.util.testing import assert_frame_equal, assert_series_equal
 from datetime import datetime
 import numpy as np
-import pickle
+import io
+import tempfile
+import time
+import threading
+from collections import OrderedDict
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import dask.dataframe as dd
+except ImportError:
+    dd = None
 
 log.basicConfig(level=log.INFO, format='%(message)s')
 
@@ -46,6 +60,86 @@ class TestDataDict(unittest.TestCase):
 
         assert_frame_equal(expected_dd.data_dict, actual_dd.data_dict)
 
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            expected_dd = DataDict(data_dict_file=data_dict_file, snapshot=True)
+            self.assertTrue(os.path.exists(expected_dd.snapshot_file))
+
+            # A change that keeps the modification time and the size of the file is not detected, so the snapshot is used.
+            stat = os.stat(data_dict_file)
+            self.dd.data_dict.replace('Name 1', 'Name X').to_csv(data_dict_file, index=False)
+            os.utime(data_dict_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            actual_dd = DataDict(data_dict_file=data_dict_file, snapshot=True)
+            assert_frame_equal(expected_dd.data_dict, actual_dd.data_dict)
+            self.assertEqual(expected_dd.version, actual_dd.version)
+
+            os.utime(data_dict_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            actual_dd = DataDict(data_dict_file=data_dict_file, snapshot=True)
+            self.assertEqual('Name X', actual_dd.data_dict['Name'][0])
+
+    def test_snapshot_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            with open(data_dict_file + '.snapshot', 'wb') as file:
+                file.write(b'invalid')
+
+            with self.assertWarnsRegex(UserWarning, 'could not be read'):
+                dd = DataDict(data_dict_file=data_dict_file, snapshot=True)
+
+            # The invalid snapshot is replaced with a valid one.
+            self.assertEqual(dd.version, DataDict(data_dict_file=data_dict_file, snapshot=True).version)
+
+    def test_reload_interval(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            dd = DataDict(data_dict_file=data_dict_file, reload_interval=3600)
+
+            self.dd.data_dict.replace('Name 2', 'Name 2a').to_csv(data_dict_file, index=False)
+            os.utime(data_dict_file, (0, os.path.getmtime(data_dict_file) + 1))
+
+            df = pd.DataFrame.from_records([{'field_2': '1'}])
+            self.assertEqual(['Name 2'], list(dd.remap(df, 'data_set_1').columns))
+
+            dd.reload()
+            self.assertEqual(['Name 2a'], list(dd.remap(df, 'data_set_1').columns))
+
+    def test_reload_manual(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            dd = DataDict(data_dict_file=data_dict_file, reload_strategy='manual', reload_interval=0)
+
+            os.remove(data_dict_file)
+
+            df = pd.DataFrame.from_records([{'field_2': '1'}])
+            self.assertEqual(['Name 2'], list(dd.remap(df, 'data_set_1').columns))
+
+    def test_reload_watch(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            dd = DataDict(data_dict_file=data_dict_file, reload_strategy='watch', reload_interval=0.01)
+
+            self.dd.data_dict.replace('Name 2', 'Name 2a').to_csv(data_dict_file, index=False)
+            os.utime(data_dict_file, (0, os.path.getmtime(data_dict_file) + 1))
+
+            for _ in range(500):
+                if 'Name 2a' in dd.data_dict['Name'].values:
+                    break
+                time.sleep(0.01)
+
+            dd.close()
+            self.assertIn('Name 2a', dd.data_dict['Name'].values)
+
+    def test_invalid_reload_strategy(self):
+        with self.assertRaisesRegex(ValueError, 'reload_strategy'):
+            DataDict(data_dict=self.dd.data_dict, reload_strategy='inotify')
+
     def test_data_set_df(self):
         dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
                                                        data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
@@ -60,6 +154,23 @@ class TestDataDict(unittest.TestCase):
 
         assert_frame_equal(expected_df, actual_df)
 
+    def test_data_set_df_interleaved(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
+                                                             1: ['data_set_2', 'field_1', 'Name 2', 'Description 2', 'int', '{:d}'],
+                                                             2: ['data_set_1', 'field_2', 'Name 3', 'Description 3', 'int', '{:d}']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+        actual_df = dd.df('data_set_1')
+
+        expected = {0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
+                    2: ['data_set_1', 'field_2', 'Name 3', 'Description 3', 'int', '{:d}']}
+        expected_df = (pd.DataFrame.from_dict(expected, orient='index',
+                                              columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']) \
+                       .set_index('Field'))
+
+        assert_frame_equal(expected_df, actual_df)
+        self.assertEqual(0, len(dd.df('data_set_3')))
+
     def test_data_set_df_none(self):
         dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
                                                        data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
@@ -120,7 +231,7 @@ class TestDataDict(unittest.TestCase):
         expected_df = pd.DataFrame.from_dict(expected, orient='index',
                                              columns=['Name 1', 'Name 2', 'Name 3', 'Name 4', 'Name 5', 'field_6'])
         expected_df['Name 4'] = expected_df['Name 4'].astype('float')
-        expected_df = expected_df.astype({'Name 2': 'int', 'Name 4': 'float', 'Name 5': 'datetime64', 'field_6': 'str'},
+        expected_df = expected_df.astype({'Name 2': 'int', 'Name 3': 'boolean', 'Name 4': 'float', 'Name 5': 'datetime64', 'field_6': 'str'},
                                          errors='ignore')
 
         data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern', },
@@ -236,7 +347,7 @@ class TestDataDict(unittest.TestCase):
         expected_df = pd.DataFrame.from_dict(expected, orient='index',
                                              columns=['Name 1', 'Name 2', 'Name 3', 'Name 4', 'field_5'])
         expected_df['Name 4'] = expected_df['Name 4'].astype('float')
-        expected_df = expected_df.astype({'Name 1': 'str', 'Name 2': 'int', 'Name 4': 'float', 'field_5': 'str'},
+        expected_df = expected_df.astype({'Name 1': 'str', 'Name 2': 'int', 'Name 3': 'boolean', 'Name 4': 'float', 'field_5': 'str'},
                                          errors='ignore')
 
         data = [{'field_5': 'bayern', 'field_2': '1', 'field_1': 'test 1', 'field_3': 'True', 'field_4': '1.1', },
@@ -248,6 +359,704 @@ class TestDataDict(unittest.TestCase):
 
         assert_frame_equal(expected_df, actual_df)
 
+    def test_remap_str_mixed_values(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'str', '']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+        expected_df = pd.DataFrame({'Name 1': ['test 1', None, None, None], 'Name 2': ['test 2', None, None, 'test 3'], 'field_3': ['a', np.nan, 'b', 'c']})
+
+        df = pd.DataFrame({'field_1': ['test 1', '', 1, None], 'field_2': ['test 2', np.nan, '', 'test 3'], 'field_3': ['a', '', 'b', 'c']})
+        source_df = df.copy()
+        actual_df = dd.remap(df, 'data_set_1')
+
+        assert_frame_equal(expected_df, actual_df)
+        assert_frame_equal(source_df, df)
+
+    def test_remap_bool_values(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'bool', ''],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'bool', '']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+        expected_df = pd.DataFrame({'Name 1': pd.array([True, False, True, False, True, True, False, None, None], dtype='boolean'),
+                                    'Name 2': pd.array([True, False, True, False, True, True, False, False, True], dtype='boolean')})
+
+        df = pd.DataFrame({'field_1': ['Yes', 'no', '1', '0', True, 1, 0, None, ''],
+                           'field_2': [True, False, True, False, True, True, False, False, True]})
+        actual_df = dd.remap(df, 'data_set_1')
+
+        assert_frame_equal(expected_df, actual_df)
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_remap_pyarrow(self):
+        data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'yes', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern'},
+                {'field_1': '', 'field_2': '2', 'field_3': '', 'field_4': '', 'field_5': None, 'field_6': 'bayern'}]
+        expected_df = pd.DataFrame({'Name 1': pd.array(['test 1', None], dtype=pd.ArrowDtype(pa.string())),
+                                    'Name 2': pd.array([1, 2], dtype=pd.ArrowDtype(pa.int64())),
+                                    'Name 3': pd.array([True, None], dtype=pd.ArrowDtype(pa.bool_())),
+                                    'Name 4': pd.array([1.1, None], dtype=pd.ArrowDtype(pa.float64())),
+                                    'Name 5': pd.array([datetime(2019, 1, 1), None], dtype=pd.ArrowDtype(pa.timestamp('ns'))),
+                                    'field_6': ['bayern', 'bayern']})
+
+        df = pd.DataFrame.from_records(data)
+        assert_frame_equal(expected_df, self.dd.remap(df, 'data_set_1', dtype_backend='pyarrow'))
+
+        arrow_df = df.astype(pd.ArrowDtype(pa.string()))
+        actual_df = self.dd.remap(arrow_df, 'data_set_1', dtype_backend='pyarrow')
+        assert_frame_equal(expected_df.drop(columns='field_6'), actual_df.drop(columns='field_6'))
+
+        # Arrow-backed columns that already have the right type are not copied.
+        actual_df = self.dd.remap(arrow_df[['field_6']].rename(columns={'field_6': 'field_1'}), 'data_set_1', dtype_backend='pyarrow')
+        self.assertIs(arrow_df['field_6'].array.__arrow_array__(), actual_df['Name 1'].array.__arrow_array__())
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_remap_table(self):
+        df = pd.DataFrame.from_records([{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_6': 'bayern'}])
+        table = self.dd.remap_table(df, 'data_set_1', strip_cols=True)
+
+        self.assertEqual(pa.schema([('Name 1', pa.string()), ('Name 2', pa.int64()), ('Name 3', pa.bool_())]), table.schema.remove_metadata())
+        self.assertEqual([{'Name 1': 'test 1', 'Name 2': 1, 'Name 3': True}], table.to_pylist())
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_remap_pyarrow_invalid_value(self):
+        df = pd.DataFrame.from_records([{'field_2': 'one'}])
+        with self.assertWarnsRegex(UserWarning, 'Column field_2 could not be converted'):
+            actual_df = self.dd.remap(df, 'data_set_1', dtype_backend='pyarrow')
+
+        self.assertEqual(['one'], list(actual_df['Name 2']))
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_remap_pyarrow_missing_values(self):
+        actual_df = self.dd.remap(pd.DataFrame({'field_2': ['1', '', '3'], 'field_4': ['1.5', '', '2']}), 'data_set_1', dtype_backend='pyarrow')
+
+        self.assertEqual(pd.ArrowDtype(pa.int64()), actual_df['Name 2'].dtype)
+        self.assertEqual(pd.ArrowDtype(pa.float64()), actual_df['Name 4'].dtype)
+        self.assertEqual([1, None, 3], actual_df['Name 2'].array.__arrow_array__().to_pylist())
+        self.assertFalse(hasattr(actual_df, 'conversion_report'))
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_arrow_schema(self):
+        schema = self.dd.arrow_schema('data_set_1')
+
+        self.assertEqual(['Name 1', 'Name 2', 'Name 3', 'Name 4', 'Name 5'], schema.names)
+        self.assertEqual([pa.string(), pa.int64(), pa.bool_(), pa.float64(), pa.timestamp('ns')], schema.types)
+        self.assertEqual({b'description': b'Description 2', b'format': b'{:d}'}, schema.field('Name 2').metadata)
+        self.assertEqual(self.dd.version, schema.metadata[b'datadict.version'].decode())
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_to_parquet(self):
+        data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern'}]
+        expected_df = self.dd.remap(pd.DataFrame.from_records(data), 'data_set_1')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_file = os.path.join(tmp_dir, 'data.parquet')
+            self.dd.to_parquet(expected_df, parquet_file, 'data_set_1')
+
+            assert_frame_equal(expected_df, self.dd.read_parquet(parquet_file))
+            assert_frame_equal(expected_df[['Name 4', 'Name 2']], self.dd.read_parquet(parquet_file, columns=['Name 4', 'Name 2']))
+
+            import pyarrow.parquet as pq
+            self.assertEqual({b'description': b'Description 4', b'format': '£{:.1f}m'.encode()}, pq.read_schema(parquet_file).field('Name 4').metadata)
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_read_parquet_data_dict_changed(self):
+        df = self.dd.remap(pd.DataFrame.from_records([{'field_2': '1', 'field_4': '1.1'}]), 'data_set_1')
+        dd = DataDict(data_dict=self.dd.data_dict.replace({'Type': {'int': 'float'}}))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_file = os.path.join(tmp_dir, 'data.parquet')
+            self.dd.to_parquet(df, parquet_file, 'data_set_1')
+
+            assert_frame_equal(df.astype({'Name 2': 'float'}), dd.read_parquet(parquet_file))
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_read_parquet_not_remapped(self):
+        df = pd.DataFrame.from_records([{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_6': 'bayern'}])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_file = os.path.join(tmp_dir, 'data.parquet')
+            df.to_parquet(parquet_file)
+
+            assert_frame_equal(self.dd.remap(df[['field_3', 'field_1']], 'data_set_1'),
+                               self.dd.read_parquet(parquet_file, 'data_set_1', columns=['Name 3', 'Name 1']))
+
+    @unittest.skipIf(dd is None, 'dask is not installed')
+    def test_remap_dask(self):
+        data = [{'field_1': f'test {i}', 'field_2': str(i), 'field_3': 'True' if i % 2 else '', 'field_4': '1.1', 'field_5': '2019-01-01',
+                 'field_6': 'bayern'} for i in range(10)]
+        df = pd.DataFrame.from_records(data)
+        expected_df = self.dd.remap(df, 'data_set_1', ensure_cols=True)
+
+        ddf = self.dd.remap_dask(dd.from_pandas(df, npartitions=3), 'data_set_1', ensure_cols=True)
+        assert_series_equal(expected_df.dtypes, ddf.dtypes)
+        assert_frame_equal(expected_df, ddf.compute(scheduler='synchronous'))
+        assert_frame_equal(expected_df, ddf.compute(scheduler='processes'))
+
+    @unittest.skipIf(dd is None, 'dask is not installed')
+    def test_remap_dask_missing_values(self):
+        ddf = dd.from_pandas(pd.DataFrame({'field_2': ['1', '2', '3', '']}), npartitions=2)
+
+        remapped_ddf = self.dd.remap_dask(ddf, 'data_set_1')
+        self.assertEqual('int64', remapped_ddf.dtypes['Name 2'])
+        with self.assertWarnsRegex(UserWarning, 'Name 2.+int64'):
+            remapped_ddf.compute(scheduler='synchronous')
+
+        remapped_ddf = DataDict(data_dict=self.dd.data_dict, nullable=True).remap_dask(ddf, 'data_set_1')
+        self.assertEqual('Int64', remapped_ddf.dtypes['Name 2'])
+        assert_series_equal(pd.Series([1, 2, 3, None], dtype='Int64', name='Name 2'), remapped_ddf.compute(scheduler='synchronous')['Name 2'])
+
+    @unittest.skipIf(dd is None, 'dask is not installed')
+    def test_read_csv_dask(self):
+        csv = 'field_1,field_2,field_3,field_6\ntest 1,1,True,bayern\n,2,,dortmund\n'
+        expected_df = self.dd.read_csv(io.StringIO(csv), 'data_set_1', strip_cols=True)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'data.csv'), 'w') as file:
+                file.write(csv)
+
+            ddf = self.dd.read_csv_dask(os.path.join(tmp_dir, '*.csv'), 'data_set_1', strip_cols=True)
+            assert_series_equal(expected_df.dtypes, ddf.dtypes)
+            assert_frame_equal(expected_df, ddf.compute(scheduler='synchronous'))
+
+    @unittest.skipIf(dd is None or pa is None, 'dask or pyarrow is not installed')
+    def test_read_parquet_dask(self):
+        df = pd.DataFrame.from_records([{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_6': 'bayern'}])
+        expected_df = self.dd.remap(df[['field_3', 'field_2']], 'data_set_1')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_file = os.path.join(tmp_dir, 'raw.parquet')
+            df.to_parquet(raw_file)
+            assert_frame_equal(expected_df, self.dd.read_parquet_dask(raw_file, 'data_set_1', columns=['Name 3', 'Name 2']).compute(scheduler='synchronous'))
+
+            remapped_file = os.path.join(tmp_dir, 'remapped.parquet')
+            self.dd.to_parquet(self.dd.remap(df, 'data_set_1'), remapped_file)
+            assert_frame_equal(expected_df[['Name 3', 'Name 2']],
+                               self.dd.read_parquet_dask(remapped_file, columns=['Name 3', 'Name 2']).compute(scheduler='synchronous'))
+
+    @unittest.skipIf(dd is None or pa is None, 'dask or pyarrow is not installed')
+    def test_read_parquet_dask_version(self):
+        from unittest import mock
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Name=['field_1', 'Name 2', 'Name 3', 'Name 4', 'Name 5']))
+        df = data_dict.remap(pd.DataFrame.from_records([{'field_1': 'test 1', 'field_2': '1'}]), 'data_set_1')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            remapped_file = os.path.join(tmp_dir, 'remapped.parquet')
+            data_dict.to_parquet(df, remapped_file)
+
+            with mock.patch.object(DataDict, 'remap_dask') as remap_dask:
+                actual_df = data_dict.read_parquet_dask(remapped_file, 'data_set_1').compute(scheduler='synchronous')
+            remap_dask.assert_not_called()
+            assert_frame_equal(df, actual_df)
+
+            changed_dict = DataDict(data_dict=data_dict.data_dict.assign(Type=['str', 'float', 'bool', 'float', 'datetime64']))
+            actual_df = changed_dict.read_parquet_dask(remapped_file, 'data_set_1').compute(scheduler='synchronous')
+            assert_frame_equal(changed_dict.read_parquet(remapped_file, 'data_set_1'), actual_df)
+            self.assertEqual('float64', actual_df['Name 2'].dtype)
+
+    @unittest.skipIf(dd is None, 'dask is not installed')
+    def test_read_csv_dask_errors(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'data.csv'), 'w') as file:
+                file.write('field_4\n1.1\nnone given\n')
+
+            with self.assertRaises(ValueError):
+                self.dd.read_csv_dask(os.path.join(tmp_dir, '*.csv'), 'data_set_1', errors='raise').compute(scheduler='synchronous')
+
+            actual_df = self.dd.read_csv_dask(os.path.join(tmp_dir, '*.csv'), 'data_set_1', errors='coerce').compute(scheduler='synchronous')
+            assert_series_equal(pd.Series([1.1, np.nan], name='Name 4'), actual_df['Name 4'])
+
+    def test_invalid_dtype_backend(self):
+        with self.assertRaisesRegex(ValueError, 'dtype_backend'):
+            self.dd.remap(pd.DataFrame(), 'data_set_1', dtype_backend='arrow')
+
+    def test_remap_iter(self):
+        csv = 'field_1,field_2,field_3,field_4,field_5,field_6\n' \
+              'test 1,1,True,1.1,2019-01-01,bayern\n' \
+              'test 2,2,FALSE,1.2,2019-01-02,bayern\n' \
+              ',3,,,,\n'
+
+        expected_df = self.dd.remap(pd.read_csv(io.StringIO(csv), dtype=str, keep_default_na=False), 'data_set_1')
+        chunks = list(self.dd.remap_iter(pd.read_csv(io.StringIO(csv), dtype=str, keep_default_na=False, chunksize=2), 'data_set_1'))
+
+        self.assertEqual(2, len(chunks))
+        for chunk in chunks:
+            assert_series_equal(expected_df.dtypes, chunk.dtypes)
+        assert_frame_equal(expected_df, pd.concat(chunks))
+
+    def test_remap_iter_missing_values(self):
+        chunks = [pd.DataFrame({'field_2': ['1', '2']}), pd.DataFrame({'field_2': ['3', '']})]
+
+        with self.assertWarnsRegex(UserWarning, 'Name 2'):
+            actual_chunks = list(self.dd.remap_iter(chunks, 'data_set_1'))
+        self.assertEqual(['int64', 'object'], [str(chunk['Name 2'].dtype) for chunk in actual_chunks])
+
+        with self.assertRaisesRegex(ValueError, 'could not be converted'):
+            list(self.dd.remap_iter(chunks, 'data_set_1', errors='raise'))
+
+        actual_chunks = list(DataDict(data_dict=self.dd.data_dict, nullable=True).remap_iter(chunks, 'data_set_1', errors='raise'))
+        self.assertEqual(['Int64', 'Int64'], [str(chunk['Name 2'].dtype) for chunk in actual_chunks])
+
+    def test_remap_iter_lossy_dtypes(self):
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64']))
+        chunks = [pd.DataFrame({'field_1': ['a', 'b'], 'field_2': [1.0, 2.0], 'field_7': [1, 2]}),
+                  pd.DataFrame({'field_1': ['a', 'c'], 'field_2': [1.5, 2.0], 'field_7': [1.7, 2.2]})]
+
+        with self.assertWarns(UserWarning):
+            actual_chunks = list(data_dict.remap_iter(chunks, 'data_set_1'))
+        self.assertEqual(['a', 'c'], actual_chunks[1]['Name 1'].tolist())
+        self.assertEqual([1.5, 2.0], actual_chunks[1]['Name 2'].tolist())
+        self.assertEqual([1.7, 2.2], actual_chunks[1]['field_7'].tolist())
+        self.assertEqual([('int64', 'int64'), ('float64', 'float64')], [(str(chunk['Name 2'].dtype), str(chunk['field_7'].dtype)) for chunk in actual_chunks])
+
+        with self.assertRaisesRegex(ValueError, 'field_7'):
+            list(data_dict.remap_iter([chunks[0], pd.DataFrame({'field_1': ['a', 'b'], 'field_2': [1.0, 2.0], 'field_7': [1.7, 2.2]})], 'data_set_1',
+                                      errors='raise'))
+
+    def test_remap_iter_ensure_cols_none_data_set(self):
+        with self.assertRaises(ValueError):
+            self.dd.remap_iter([], None, True)
+
+    def test_remap_errors(self):
+        df = pd.DataFrame({'field_2': ['1', 'one', '3'], 'field_4': ['1.1', '2.2', '3.3'], 'field_5': ['2019-01-01', 'never', '']})
+
+        actual_df = self.dd.remap(df, 'data_set_1')
+        self.assertEqual({'Name 2': 'object', 'Name 4': 'float64', 'Name 5': 'object'}, actual_df.dtypes.astype(str).to_dict())
+        self.assertEqual({'Name 2': ('int', 1, ['one']), 'Name 5': ('datetime64', 1, ['never'])},
+                         {col: tuple(values) for (col, values) in actual_df.conversion_report.iterrows()})
+
+        actual_df = self.dd.remap(df, 'data_set_1', errors='coerce')
+        expected_df = pd.DataFrame({'Name 2': [1, np.nan, 3], 'Name 4': [1.1, 2.2, 3.3], 'Name 5': [datetime(2019, 1, 1), pd.NaT, pd.NaT]})
+        assert_frame_equal(expected_df, actual_df)
+
+        with self.assertRaisesRegex(ValueError, '1 values of column field_2 could not be converted to int'):
+            self.dd.remap(df, 'data_set_1', errors='raise')
+
+    def test_remap_errors_float_to_int(self):
+        df = pd.DataFrame({'field_2': [1.5, 2.0]})
+
+        with self.assertRaisesRegex(ValueError, '1 values of column field_2 could not be converted to int, e.g. \\[1.5\\]'):
+            self.dd.remap(df, 'data_set_1', errors='raise')
+
+        assert_series_equal(pd.Series([np.nan, 2.0], name='Name 2'), self.dd.remap(df, 'data_set_1', errors='coerce')['Name 2'])
+        assert_series_equal(pd.Series([1, 2], name='Name 2'), self.dd.remap(pd.DataFrame({'field_2': [1.0, 2.0]}), 'data_set_1', errors='raise')['Name 2'])
+
+    def test_remap_errors_no_failures(self):
+        actual_df = self.dd.remap(pd.DataFrame({'field_2': ['1', '2'], 'field_5': ['2019-01-01', '']}), 'data_set_1', errors='raise')
+
+        self.assertEqual({'Name 2': 'int64', 'Name 5': 'datetime64[ns]'}, actual_df.dtypes.astype(str).to_dict())
+        self.assertFalse(hasattr(actual_df, 'conversion_report'))
+
+    def test_remap_timedelta(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'timedelta', '{:}'],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'int', '{:d}']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+        actual_df = dd.remap(pd.DataFrame({'field_1': ['1 days', ''], 'field_2': ['1', '2']}), 'data_set_1')
+        assert_frame_equal(pd.DataFrame({'Name 1': pd.to_timedelta(['1 days', None]), 'Name 2': [1, 2]}), actual_df)
+
+    def test_remap_parse_options(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'datetime64', '{:}', '%d/%m/%Y %H:%M', 'Europe/London', ''],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'datetime64', '{:}', '', '', 's'],
+                                                             2: ['data_set_1', 'field_3', 'Name 3', 'Description 3', 'timedelta', '{:}', '', '', 'ms']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format', 'Parse Format', 'Time Zone', 'Unit']))
+        df = pd.DataFrame({'field_1': ['01/07/2019 10:30', '01/07/2019 10:30', '', 'never'], 'field_2': [1546300800, 1546300800, np.nan, 0],
+                           'field_3': ['1500', '1500', '', '2']})
+
+        actual_df = dd.remap(df, 'data_set_1')
+        self.assertEqual({'Name 1': ('datetime64', 1, ['never'])}, {col: tuple(values) for (col, values) in actual_df.conversion_report.iterrows()})
+
+        actual_df = dd.remap(df, 'data_set_1', errors='coerce')
+        expected_df = pd.DataFrame({'Name 1': pd.DatetimeIndex([datetime(2019, 7, 1, 10, 30), datetime(2019, 7, 1, 10, 30), None, None]).tz_localize('Europe/London'),
+                                    'Name 2': [datetime(2019, 1, 1), datetime(2019, 1, 1), None, datetime(1970, 1, 1)],
+                                    'Name 3': pd.to_timedelta([1500, 1500, None, 2], unit='ms')})
+        assert_frame_equal(expected_df, actual_df)
+
+        actual_df = dd.read_csv(io.StringIO('field_1,field_3\n01/07/2019 10:30,1500\n'), 'data_set_1')
+        assert_frame_equal(expected_df[['Name 1', 'Name 3']].iloc[:1], actual_df)
+
+    def test_remap_time_zone_dst(self):
+        dd = DataDict(data_dict=self.dd.data_dict.assign(**{'Time Zone': ['', '', '', '', 'Europe/London']}))
+        df = pd.DataFrame({'field_5': ['2019-10-27 01:30:00', '2019-03-31 01:30:00', '2019-07-01 10:30:00']})
+
+        actual_df = dd.remap(df, 'data_set_1', errors='coerce')
+        expected = pd.DatetimeIndex([None, None, datetime(2019, 7, 1, 10, 30)]).tz_localize('Europe/London')
+        assert_series_equal(pd.Series(expected, name='Name 5'), actual_df['Name 5'])
+        self.assertEqual(('datetime64', 2, ['2019-10-27 01:30:00', '2019-03-31 01:30:00']), tuple(actual_df.conversion_report.loc['Name 5']))
+
+        with self.assertRaisesRegex(ValueError, '2019-10-27 01:30:00'):
+            dd.remap(df, 'data_set_1', errors='raise')
+
+    def test_invalid_parse_options(self):
+        data_dict = self.dd.data_dict.assign(Unit=['', '', '', '', 's'])
+        DataDict.validate(data_dict)
+
+        with self.assertRaisesRegex(ValueError, 'Unit.+Name 1'):
+            DataDict.validate(data_dict.assign(Unit=['s', '', '', '', '']))
+
+        with self.assertRaisesRegex(ValueError, 'unsupported units'):
+            DataDict.validate(data_dict.assign(Unit=['', '', '', '', 'fortnight']))
+
+        with self.assertRaisesRegex(ValueError, 'Parse Format and Unit'):
+            DataDict.validate(data_dict.assign(**{'Parse Format': ['', '', '', '', '%Y']}))
+
+        with self.assertRaisesRegex(ValueError, 'unknown time zone'):
+            DataDict.validate(self.dd.data_dict.assign(**{'Time Zone': ['', '', '', '', 'Mars/Olympus']}))
+
+    def test_remap_categories(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'category', '{:}', 'low|medium|high', 'yes'],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'category', '{:}', '', '']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format', 'Categories', 'Ordered']))
+        expected_dtype = pd.CategoricalDtype(['low', 'medium', 'high'], ordered=True)
+
+        chunks = [pd.DataFrame({'field_1': ['high', ''], 'field_2': ['a', 'b']}), pd.DataFrame({'field_1': ['low', 'medium'], 'field_2': ['c', 'a']})]
+        actual_dfs = [dd.remap(chunk, 'data_set_1') for chunk in chunks]
+        self.assertEqual([expected_dtype, expected_dtype], [df['Name 1'].dtype for df in actual_dfs])
+        self.assertEqual([2, -1, 0, 1], list(pd.concat(actual_dfs)['Name 1'].cat.codes))
+        self.assertEqual('category', actual_dfs[0]['Name 2'].dtype)
+
+        actual_df = dd.remap(pd.DataFrame({'field_1': ['low', 'extreme']}), 'data_set_1', errors='coerce')
+        self.assertEqual(('category', 1, ['extreme']), tuple(actual_df.conversion_report.loc['Name 1']))
+        self.assertEqual('low', actual_df['Name 1'][0])
+        self.assertTrue(pd.isna(actual_df['Name 1'][1]))
+
+    def test_remap_numeric_categories(self):
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64'], Categories=['1|2|3', '', '', '', '']))
+        expected_dtype = pd.CategoricalDtype([1, 2, 3])
+
+        actual_dfs = [data_dict.remap(pd.DataFrame({'field_1': [1, 2]}), 'data_set_1'), data_dict.remap(pd.DataFrame({'field_1': ['3', '', '4']}), 'data_set_1', errors='coerce')]
+        self.assertEqual([expected_dtype, expected_dtype], [df['Name 1'].dtype for df in actual_dfs])
+        self.assertEqual([0, 1, 2, -1, -1], list(pd.concat(actual_dfs)['Name 1'].cat.codes))
+        self.assertFalse(hasattr(actual_dfs[0], 'conversion_report'))
+        self.assertEqual(('category', 1, ['4']), tuple(actual_dfs[1].conversion_report.loc['Name 1']))
+
+        actual_df = data_dict.read_csv(io.StringIO('field_1\n2\n1\n'), 'data_set_1')
+        self.assertEqual(expected_dtype, actual_df['Name 1'].dtype)
+
+        with self.assertRaisesRegex(ValueError, 'duplicates'):
+            DataDict.validate(data_dict.data_dict.assign(Categories=['1|01', '', '', '', '']))
+
+    @unittest.skipIf(pa is None or dd is None, 'pyarrow or dask is not installed')
+    def test_remap_pyarrow_numeric_categories(self):
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64'], Categories=['1|2', '', '', '', '']))
+        df = pd.DataFrame({'field_1': ['1', '2', '1']})
+
+        expected_type = pa.dictionary(pa.int32(), pa.int64())
+        self.assertEqual(pd.ArrowDtype(expected_type), data_dict.remap(df, 'data_set_1', dtype_backend='pyarrow')['Name 1'].dtype)
+        self.assertEqual(expected_type, data_dict.arrow_schema('data_set_1').field('Name 1').type)
+
+        ddf = data_dict.remap_dask(dd.from_pandas(df, npartitions=2), 'data_set_1', dtype_backend='pyarrow')
+        self.assertEqual(ddf.dtypes['Name 1'], ddf.compute(scheduler='synchronous')['Name 1'].dtype)
+
+    @unittest.skipIf(dd is None, 'dask is not installed')
+    def test_remap_dask_categories(self):
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64'], Categories=['a|b', '', '', '', '']))
+
+        ddf = data_dict.remap_dask(dd.from_pandas(pd.DataFrame({'field_1': ['a', 'b', 'a']}), npartitions=2), 'data_set_1')
+        self.assertEqual(pd.CategoricalDtype(['a', 'b']), ddf.dtypes['Name 1'])
+        self.assertTrue(ddf['Name 1'].cat.known)
+        self.assertEqual([0, 1, 0], list(ddf.compute(scheduler='synchronous')['Name 1'].cat.codes))
+
+    def test_invalid_categories(self):
+        data_dict = self.dd.data_dict.assign(Categories=['', '', '', '', ''], Ordered=['', '', '', '', ''])
+
+        with self.assertRaisesRegex(ValueError, 'Categories.+Name 1'):
+            DataDict.validate(data_dict.assign(Categories=['a|b', '', '', '', '']))
+
+        with self.assertRaisesRegex(ValueError, 'Ordered.+Name 1'):
+            DataDict.validate(data_dict.assign(Ordered=['yes', '', '', '', '']))
+
+        with self.assertRaisesRegex(ValueError, 'duplicates'):
+            DataDict.validate(data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64'], Categories=['a|b|a', '', '', '', '']))
+
+    def test_remap_no_copy(self):
+        data = [{'field_1': f'test {i}', 'field_2': str(i), 'field_3': 'True' if i % 2 else '', 'field_4': 1.1, 'field_6': 'bayern'} for i in range(10)]
+        df = pd.DataFrame.from_records(data)
+
+        for (ensure_cols, strip_cols) in [(False, False), (True, False), (False, True)]:
+            expected_df = self.dd.remap(df, 'data_set_1', ensure_cols=ensure_cols, strip_cols=strip_cols)
+            assert_frame_equal(expected_df, self.dd.remap(df, 'data_set_1', ensure_cols=ensure_cols, strip_cols=strip_cols, copy=False))
+
+        actual_df = self.dd.remap(df, 'data_set_1', copy=False)
+        self.assertTrue(np.shares_memory(df['field_4'].values, actual_df['Name 4'].values))
+        self.assertTrue(np.shares_memory(df['field_6'].values, actual_df['field_6'].values))
+        self.assertFalse(np.shares_memory(df['field_4'].values, self.dd.remap(df, 'data_set_1')['Name 4'].values))
+
+        actual_df = self.dd.remap(pd.DataFrame({'field_2': ['1', 'one']}), 'data_set_1', copy=False)
+        self.assertEqual(['Name 2'], list(actual_df.conversion_report.index))
+
+        with self.assertRaisesRegex(ValueError, 'copy.+unique'):
+            self.dd.remap(pd.DataFrame([[1, 2]], columns=['field_2', 'field_2']), 'data_set_1', copy=False)
+
+    def test_remap_no_copy_peak_memory(self):
+        import tracemalloc
+        df = pd.DataFrame({'field_1': np.array(['test', ''], dtype=object)[np.arange(100_000) % 2], 'field_2': np.arange(100_000).astype(str),
+                           'field_4': np.random.rand(100_000), 'field_6': np.random.rand(100_000)})
+        self.dd.remap(df.head(), 'data_set_1', copy=False)
+
+        tracemalloc.start()
+        try:
+            self.dd.remap(df, 'data_set_1', copy=False)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak, 1.5 * df.memory_usage(index=False).sum())
+
+    def test_invalid_errors(self):
+        with self.assertRaisesRegex(ValueError, 'errors'):
+            self.dd.remap(pd.DataFrame(), 'data_set_1', errors='skip')
+
+    def test_remap_nullable(self):
+        dd = DataDict(data_dict=self.dd.data_dict, nullable=True)
+        df = pd.DataFrame({'field_1': ['test 1', ''], 'field_2': ['1', ''], 'field_3': ['True', ''], 'field_4': ['1.1', '']})
+
+        actual_df = dd.remap(df, 'data_set_1')
+        expected_df = pd.DataFrame({'Name 1': pd.array(['test 1', None], dtype='string'), 'Name 2': pd.array([1, None], dtype='Int64'),
+                                    'Name 3': pd.array([True, None], dtype='boolean'), 'Name 4': [1.1, np.nan]})
+        assert_frame_equal(expected_df, actual_df)
+        self.assertEqual('object', self.dd.remap(df, 'data_set_1')['Name 2'].dtype)
+
+    def test_remap_nullable_column(self):
+        data_dict = self.dd.data_dict.assign(Nullable=['', 'yes', '', '', ''])
+        df = pd.DataFrame({'field_1': ['test 1', ''], 'field_2': ['1', '']})
+
+        actual_df = DataDict(data_dict=data_dict).remap(df, 'data_set_1')
+        self.assertEqual({'Name 1': 'object', 'Name 2': 'Int64'}, actual_df.dtypes.astype(str).to_dict())
+
+        actual_df = DataDict(data_dict=data_dict.assign(Nullable=['', 'no', '', '', '']), nullable=True).remap(df, 'data_set_1')
+        self.assertEqual({'Name 1': 'string', 'Name 2': 'object'}, actual_df.dtypes.astype(str).to_dict())
+
+    def test_remap_nullable_errors(self):
+        dd = DataDict(data_dict=self.dd.data_dict, nullable=True)
+        df = pd.DataFrame({'field_2': ['1', '1.5', None, 'one']})
+
+        actual_df = dd.remap(df, 'data_set_1')
+        self.assertEqual(('int', 2, ['1.5', 'one']), tuple(actual_df.conversion_report.loc['Name 2']))
+
+        actual_df = dd.remap(df, 'data_set_1', errors='coerce')
+        assert_series_equal(pd.Series([1, None, None, None], dtype='Int64', name='Name 2'), actual_df['Name 2'])
+
+    def test_remap_optimise(self):
+        data = [{'field_1': 'bayern' if i % 3 else 'dortmund', 'field_2': str(i * 10), 'field_3': 'True', 'field_4': '4.5', 'field_6': 'bayern'}
+                for i in range(10)]
+        actual_df = self.dd.remap(pd.DataFrame.from_records(data), 'data_set_1', optimise=True)
+
+        self.assertEqual({'Name 1': 'category', 'Name 2': 'int8', 'Name 3': 'boolean', 'Name 4': 'float32', 'field_6': 'object'},
+                         actual_df.dtypes.astype(str).to_dict())
+        self.assertEqual(['Name 1', 'Name 2', 'Name 3', 'Name 4'], list(actual_df.memory_report.index))
+        self.assertEqual(['object', 'int64', 'boolean', 'float64'], list(actual_df.memory_report['Type Before']))
+        self.assertTrue((actual_df.memory_report['Bytes After'] <= actual_df.memory_report['Bytes Before']).all())
+
+    def test_optimise_category_threshold(self):
+        df = self.dd.remap(pd.DataFrame({'field_1': ['bayern', 'dortmund', 'bayern', 'schalke'], 'field_2': ['1', '200', '40000', '3']}), 'data_set_1')
+        actual_df = self.dd.optimise(df, category_threshold=0.5)
+
+        self.assertEqual({'Name 1': 'object', 'Name 2': 'int32'}, actual_df.dtypes.astype(str).to_dict())
+        self.assertEqual('category', self.dd.optimise(df, category_threshold=0.75)['Name 1'].dtype)
+        self.assertEqual('int64', df['Name 2'].dtype)
+
+    def test_remap_parallel(self):
+        data = [{'field_1': f'test {i}', 'field_2': str(i), 'field_3': 'True' if i % 2 else '', 'field_4': '1.1', 'field_5': '2019-01-01',
+                 'field_6': 'bayern'} for i in range(10)]
+        df = pd.DataFrame.from_records(data)
+
+        assert_frame_equal(self.dd.remap(df, 'data_set_1', strip_cols=True), self.dd.remap_parallel(df, 'data_set_1', strip_cols=True, workers=2, partitions=3))
+
+    def test_remap_parallel_frames(self):
+        frames = [pd.DataFrame.from_records([{'field_2': '1', 'field_6': 'bayern'}]),
+                  pd.DataFrame.from_records([{'field_1': 'test 2', 'field_2': '2'}])]
+
+        expected_df = pd.DataFrame({'Name 1': [np.nan, 'test 2'], 'Name 2': [1, 2], 'field_6': ['bayern', np.nan]}, index=[0, 0])
+        assert_frame_equal(expected_df, self.dd.remap_parallel(frames, 'data_set_1', workers=2))
+
+    def test_remap_parallel_partition_dtypes(self):
+        data_dict = DataDict(data_dict=self.dd.data_dict.assign(Type=['category', 'int', 'bool', 'float', 'datetime64']))
+        df = pd.DataFrame({'field_1': ['a', 'b', 'c', 'd'], 'field_2': [1.0, 2.0, 1.5, 2.0]})
+
+        with self.assertWarnsRegex(UserWarning, 'Name 2'):
+            actual_df = data_dict.remap_parallel(df, 'data_set_1', workers=2)
+
+        self.assertEqual(pd.CategoricalDtype(['a', 'b', 'c', 'd']), actual_df['Name 1'].dtype)
+        self.assertEqual(['a', 'b', 'c', 'd'], actual_df['Name 1'].tolist())
+        self.assertEqual([1, 2, 1.5, 2], actual_df['Name 2'].tolist())
+
+    def test_pickle(self):
+        import pickle
+        dd = pickle.loads(pickle.dumps(self.dd))
+
+        self.assertEqual(self.dd.version, dd.version)
+        assert_frame_equal(self.dd.data_dict, dd.data_dict)
+        self.assertEqual(self.dd.formats, dd.formats)
+
+    def test_read_csv(self):
+        csv = 'field_1,field_2,field_3,field_4,field_5,field_6\n' \
+              'test 1,1,True,1.1,2019-01-01,bayern\n' \
+              'test 2,2,FALSE,1.2,2019-01-02,bayern\n' \
+              ',3,,,,bayern\n'
+
+        expected_df = self.dd.remap(pd.read_csv(io.StringIO(csv), dtype=str, keep_default_na=False), 'data_set_1')
+        actual_df = self.dd.read_csv(io.StringIO(csv), 'data_set_1')
+
+        assert_frame_equal(expected_df, actual_df)
+
+    def test_read_csv_errors(self):
+        csv = 'field_4\n1.1\nx\n'
+
+        actual_df = self.dd.read_csv(io.StringIO(csv), 'data_set_1', errors='coerce')
+        assert_frame_equal(pd.DataFrame({'Name 4': [1.1, np.nan]}), actual_df)
+        self.assertEqual(('float', 1, ['x']), tuple(actual_df.conversion_report.loc['Name 4']))
+
+        self.assertEqual('float64', self.dd.read_csv(io.StringIO('field_4\n1.1\n'), 'data_set_1')['Name 4'].dtype)
+
+        with self.assertRaisesRegex(ValueError, 'x'):
+            self.dd.read_csv(io.StringIO(csv), 'data_set_1', errors='raise')
+
+    def test_read_csv_strip_cols(self):
+        csv = 'field_1,field_2,field_4,field_6\n' \
+              'test 1,1,1.1,bayern\n'
+
+        expected_df = pd.DataFrame({'Name 1': ['test 1'], 'Name 2': [1], 'Name 4': [1.1], 'Name 3': pd.array([None], dtype='boolean'),
+                                    'Name 5': pd.Series([None], dtype='datetime64[ns]')})
+        actual_df = self.dd.read_csv(io.StringIO(csv), 'data_set_1', strip_cols=True, ensure_cols=True)
+
+        assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+    def test_read_csv_chunksize(self):
+        csv = 'field_1,field_2,field_6\n' \
+              'test 1,1,bayern\n' \
+              'test 2,2,bayern\n' \
+              'test 3,3,bayern\n'
+
+        chunks = list(self.dd.read_csv(io.StringIO(csv), 'data_set_1', chunksize=2))
+
+        self.assertEqual(2, len(chunks))
+        assert_frame_equal(self.dd.read_csv(io.StringIO(csv), 'data_set_1'), pd.concat(chunks))
+
+    def test_remap_plan_cached(self):
+        dd = DataDict(data_dict=self.dd.data_dict)
+        data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern', }]
+
+        expected_df = dd.remap(pd.DataFrame.from_records(data), 'data_set_1')
+        actual_df = dd.remap(pd.DataFrame.from_records(data), 'data_set_1')
+
+        assert_frame_equal(expected_df, actual_df)
+        self.assertEqual(1, len(dd._plans))
+
+        dd.remap(pd.DataFrame.from_records(data), 'data_set_1', strip_cols=True)
+        self.assertEqual(2, len(dd._plans))
+
+    def test_remap_plan_cache_threads(self):
+        dd = DataDict(data_dict=self.dd.data_dict)
+        dd.plan_cache_size = 1
+        cached_df = pd.DataFrame({'field_1': ['test 1']})
+        other_df = pd.DataFrame({'field_2': ['1']})
+        dd.remap(cached_df, 'data_set_1')
+
+        class Plans(OrderedDict):
+            def get(self, key, default=None):
+                # Another thread remaps a data frame with a different schema between the lookup and the update of the LRU order.
+                plan = super().get(key, default)
+                if not threads:
+                    threads.append(threading.Thread(target=dd.remap, args=(other_df, 'data_set_1')))
+                    threads[0].start()
+                    threads[0].join(0.5)
+                return plan
+
+        threads = []
+        dd._state = dd._state._replace(plans=Plans(dd._plans))
+        assert_frame_equal(self.dd.remap(cached_df, 'data_set_1'), dd.remap(cached_df, 'data_set_1'))
+        for thread in threads:
+            thread.join()
+
+    def test_remap_plan_cache_cleared_on_reload(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dict_file = os.path.join(tmp_dir, 'data_dict.csv')
+            self.dd.data_dict.to_csv(data_dict_file, index=False)
+            dd = DataDict(data_dict_file=data_dict_file, reload_interval=0)
+
+            data = [{'field_1': 'test 1', 'field_2': '1', 'field_6': 'bayern'}]
+            self.assertEqual(['Name 1', 'Name 2', 'field_6'], list(dd.remap(pd.DataFrame.from_records(data), 'data_set_1').columns))
+
+            self.dd.data_dict.replace('Name 2', 'Name 2a').to_csv(data_dict_file, index=False)
+            os.utime(data_dict_file, (0, os.path.getmtime(data_dict_file) + 1))
+
+            self.assertEqual(['Name 1', 'Name 2a', 'field_6'], list(dd.remap(pd.DataFrame.from_records(data), 'data_set_1').columns))
+            self.assertEqual(1, len(dd._plans))
+            self.assertEqual(2, dd.metrics()['loads'])
+            self.assertEqual(1, dd.metrics()['reloads'])
+
+    def test_remap_plan_not_cached_across_reload(self):
+        from unittest import mock
+        dd = DataDict(data_dict=self.dd.data_dict)
+        compile_plan = DataDict._DataDict__compile_plan
+
+        # Simulates the watcher thread swapping in a new data dictionary while the plan is compiled.
+        def compile_plan_and_reload(data_dict, *args):
+            plan = compile_plan(data_dict, *args)
+            data_dict._DataDict__set_data_dict(self.dd.data_dict.replace('Name 2', 'Name 2a'))
+            return plan
+
+        with mock.patch.object(DataDict, '_DataDict__compile_plan', compile_plan_and_reload):
+            dd.remap(pd.DataFrame({'field_2': ['1']}), 'data_set_1')
+
+        self.assertEqual(0, len(dd._plans))
+        self.assertEqual(['Name 2a'], list(dd.remap(pd.DataFrame({'field_2': ['1']}), 'data_set_1').columns))
+
+    def test_profile(self):
+        data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern', }]
+
+        with DataDict.profile(trace_memory=True) as timings:
+            df = self.dd.remap(pd.DataFrame.from_records(data), 'data_set_1')
+            self.dd.format(DataDict.add_stats(df[['Name 2', 'Name 4']]))
+
+        self.assertEqual([('remap', 'plan'), ('remap', 'str'), ('remap', 'blank'), ('remap', 'bool'), ('remap', 'astype'), ('remap', 'rename'),
+                          ('remap', 'columns'), ('add_stats', 'stats'), ('add_stats', 'concat'), ('format', 'format')],
+                         [(timing.operation, timing.stage) for timing in timings])
+        self.assertEqual((1, 6), (timings[6].rows, timings[6].columns))
+        self.assertTrue(all(timing.seconds >= 0 and timing.bytes > 0 and timing.allocated is not None for timing in timings))
+        self.assertEqual([], DataDict.listeners)
+
+    def test_add_listener(self):
+        timings = []
+        DataDict.add_listener(timings.append)
+        try:
+            self.dd.remap(pd.DataFrame.from_records([{'field_1': 'test 1'}]), 'data_set_1')
+        finally:
+            DataDict.remove_listener(timings.append)
+
+        self.assertEqual(7, len(timings))
+        self.assertIsNone(timings[0].allocated)
+
+    def test_add_listener_stage_output(self):
+        for copy in [True, False]:
+            timings = []
+            DataDict.add_listener(timings.append)
+            try:
+                self.dd.remap(pd.DataFrame.from_records([{'field_1': 'test 1', 'field_3': 'True'}] * 10), 'data_set_1', copy=copy)
+            finally:
+                DataDict.remove_listener(timings.append)
+
+            stages = {timing.stage: timing for timing in timings}
+            self.assertEqual((10, 2), (stages['bool'].rows, stages['bool'].columns))
+            self.assertLess(stages['bool'].bytes, stages['blank'].bytes)
+
+    def test_metrics(self):
+        dd = DataDict(data_dict=self.dd.data_dict)
+        data = [{'field_1': 'test 1', 'field_2': '1'}]
+        for _ in range(3):
+            dd.format(dd.remap(pd.DataFrame.from_records(data), 'data_set_1'))
+
+        metrics = dd.metrics()
+        self.assertEqual((1, 0), (metrics['loads'], metrics['reloads']))
+        self.assertEqual((2, 1, 2 / 3, 1), (metrics['plan_hits'], metrics['plan_misses'], metrics['plan_hit_rate'], metrics['plans_cached']))
+        self.assertEqual((3, 3), (metrics['remaps'], metrics['formats']))
+        self.assertGreater(metrics['load_seconds'], 0)
+
     def test_reorder(self):
         dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
                                                        data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
@@ -261,7 +1070,7 @@ class TestDataDict(unittest.TestCase):
         expected_df = pd.DataFrame.from_dict(expected, orient='index',
                                              columns=['Name 1', 'Name 2', 'Name 3', 'Name 4', 'field_5'])
         expected_df['Name 4'] = expected_df['Name 4'].astype('float')
-        expected_df = expected_df.astype({'Name 1': 'str', 'Name 2': 'int', 'Name 4': 'float', 'field_5': 'str'},
+        expected_df = expected_df.astype({'Name 1': 'str', 'Name 2': 'int', 'Name 3': 'boolean', 'Name 4': 'float', 'field_5': 'str'},
                                          errors='ignore')
 
         data = [{'field_5': 'bayern', 'field_2': '1', 'field_1': 'test 1', 'field_3': 'True', 'field_4': '1.1', }]
@@ -271,6 +1080,12 @@ class TestDataDict(unittest.TestCase):
 
         assert_frame_equal(expected_df, actual_df)
 
+    def test_reorder_unknown_cols(self):
+        df = pd.DataFrame(columns=['field_9', 'Name 4', 'field_8', 'Name 1', 'Name 3'])
+        actual_df = self.dd.reorder(df)
+
+        self.assertEqual(['Name 1', 'Name 3', 'Name 4', 'field_9', 'field_8'], list(actual_df.columns))
+
     def test_ensure_cols_df_additional_cols(self):
         dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
                                                        data={},
@@ -397,6 +1212,27 @@ class TestDataDict(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, f'Either data_set can be provide or any_data_set can be True but not both.'):
             dd.strip_cols(df, data_set='data_set_1', any_data_set=True)
 
+    def test_aggregate(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', '', ''],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'int', '{:d}', 'sum()'],
+                                                             2: ['data_set_1', 'field_3', 'Name 3', 'Description 3', 'float', '{:.1f}', 'quantile(0.5)'],
+                                                             3: ['data_set_1', 'field_4', 'Name 4', 'Description 4', 'float', '{:.1f}', 'max']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format', 'Default Aggregation']))
+
+        df = pd.DataFrame({'Name 1': ['a', 'a', 'b'], 'Name 2': [1, 2, 3], 'Name 3': [1.0, 3.0, 5.0], 'Name 4': [1.5, 0.5, 2.5], 'field_5': [1, 1, 1]})
+
+        assert_series_equal(pd.Series({'Name 2': 6.0, 'Name 3': 3.0, 'Name 4': 2.5}), dd.aggregate(df))
+
+        expected_df = pd.DataFrame({'Name 2': [3, 3], 'Name 3': [2.0, 5.0], 'Name 4': [1.5, 2.5]}, index=pd.Index(['a', 'b'], name='Name 1'))
+        assert_frame_equal(expected_df, dd.aggregate(df, by='Name 1'))
+
+    def test_invalid_aggregation(self):
+        with self.assertRaisesRegex(ValueError, 'default aggregation .+ is not supported'):
+            DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                      data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'int', '', '__import__("os").getcwd()']},
+                                                      columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format', 'Default Aggregation']))
+
     def test_has_stats_with_stats(self):
         data = [{'field_1': 'test 1', 'field_2': '1', 'field_3': 'True', 'field_4': '1.1', 'field_5': '2019-01-01', 'field_6': 'bayern', },
                 {'field_1': 'test 3', 'field_2': '3', 'field_3': '', 'field_4': '', 'field_5': '', 'field_6': 'bayern', }]
@@ -462,6 +1298,24 @@ class TestDataDict(unittest.TestCase):
         assert_frame_equal(expected_df, actual_df, check_dtype=False)
         self.assertEqual({'sum': 'Total', 'mean': 'Average'}, actual_df.stats)
 
+    def test_add_stats_not_inline(self):
+        df = pd.DataFrame({'Name 1': ['a', 'a', 'b'], 'Name 2': [1, 2, 3], 'Name 4': [1.5, np.nan, 2.5]})
+        actual_df = self.dd.add_stats(df, inline=False)
+
+        expected_stats_df = pd.DataFrame({'Name 2': [6.0, 2.0], 'Name 4': [4.0, 2.0]}, index=['Total', 'Average'])
+        assert_frame_equal(df, actual_df)
+        assert_frame_equal(expected_stats_df, actual_df.stats_df)
+        self.assertFalse(self.dd.has_stats(actual_df))
+
+    def test_add_stats_subtotals(self):
+        df = pd.DataFrame({'Name 1': ['a', 'a', 'b'], 'Name 2': [1, 2, 3], 'Name 4': [1.5, 0.5, 2.5]}).set_index('Name 1')
+        actual_df = self.dd.add_stats(df, subtotals='Name 1')
+
+        expected_subtotals = pd.DataFrame([[3, 1.5, 2.0, 1.0], [3, 3.0, 2.5, 2.5]], index=pd.Index(['a', 'b'], name='Name 1'),
+                                          columns=pd.MultiIndex.from_product([['Name 2', 'Name 4'], ['Total', 'Average']]))
+        assert_frame_equal(expected_subtotals, actual_df.subtotals)
+        self.assertEqual(5, len(actual_df))
+
     def test_format(self):
         expected = {0: ['test 1', '1', 'True', '£1.1m', 'January 01, 2019', 'bayern'],
                     1: ['test 3', '3', '-', '-', '-', 'bayern']}
@@ -479,6 +1333,22 @@ class TestDataDict(unittest.TestCase):
         self.maxDiff = None
         assert_frame_equal(expected_df, actual_df)
 
+    def test_format_compiled(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'float', '{:,.0f}'],
+                                                             1: ['data_set_1', 'field_2', 'Name 2', 'Description 2', 'float', '{:.0f}%'],
+                                                             2: ['data_set_1', 'field_3', 'Name 3', 'Description 3', 'datetime64', 'Week of {:%d/%m/%Y} {{GW}}']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type', 'Format']))
+
+        expected_df = pd.DataFrame({'Name 1': ['1,234,567', '-', '1,234,567'], 'Name 2': ['50%', '50%', '-'],
+                                    'Name 3': ['Week of 09/08/2019 {GW}', '-', 'Week of 09/08/2019 {GW}']})
+
+        df = pd.DataFrame({'Name 1': [1234567.0, np.nan, 1234567.0], 'Name 2': [50.0, 50.0, np.nan],
+                           'Name 3': pd.to_datetime(['2019-08-09', None, '2019-08-09'])})
+        actual_df = dd.format(df)
+
+        assert_frame_equal(expected_df, actual_df)
+
     def test_format_unmapped_cols(self):
         expected = {0: ['test 1', 1, 1.0, True, datetime(2019, 1, 1), '-'],
                     1: ['test 3', 3, 3.0, False, datetime(2019, 1, 3), '-']}
@@ -514,9 +1384,17 @@ class TestDataDict(unittest.TestCase):
         self.maxDiff = None
         assert_frame_equal(expected_df, actual_df)
 
+    def test_format_nullable_with_stats(self):
+        dd = DataDict(data_dict=self.dd.data_dict, nullable=True)
+
+        df = dd.remap(pd.DataFrame({'field_2': ['1', '', '2']}), 'data_set_1')
+        actual_df = dd.format(dd.add_stats(df))
+        self.assertEqual(['3', '1.5', '1', '-', '2'], list(actual_df['Name 2']))
+
     def test_meta(self):
         # Tests that the meta data dictionary is a valid data dictionary.
         DataDict.validate(DataDict.meta.data_dict)
+        self.assertIs(DataDict.meta, DataDict.meta)
 
     def test_missing_column(self):
         with self.assertRaisesRegex(ValueError, f'{DataDict.column_names}'):
@@ -566,4 +1444,15 @@ class TestDataDict(unittest.TestCase):
                                                        columns=['Data Set', 'Field', 'Name', 'Description', 'Type',
                                                                 'Format']))
 
-        self.assertEqual(hash(dd), hash(pickle.dumps(dd.data_dict)))
+        self.assertEqual(hash(dd), hash(DataDict(data_dict=dd.data_dict.copy())))
+        self.assertNotEqual(hash(dd), hash(DataDict(data_dict=dd.data_dict.replace('Name 3', 'Name 4'))))
+
+    def test_version(self):
+        dd = DataDict(data_dict=pd.DataFrame.from_dict(orient='index',
+                                                       data={0: ['data_set_1', 'field_1', 'Name 1', 'Description 1', 'str', ''],
+                                                             1: ['', '', 'Name 2', 'Description 2', 'int', '{:d}']},
+                                                       columns=['Data Set', 'Field', 'Name', 'Description', 'Type',
+                                                                'Format']))
+
+        self.assertEqual(dd.version, DataDict(data_dict=dd.data_dict.copy()).version)
+        self.assertNotEqual(dd.version, DataDict(data_dict=dd.data_dict.replace('{:d}', '{:.1f}')).version)